@@ -32,4 +32,14 @@ api.interceptors.response.use(
   }
 );
 
+// Subscribe to live dashboard updates (Server-Sent Events) for the logged-in role.
+// Calls onEvent(type, data) for each event and returns a function that closes the stream.
+export function subscribeToEvents(eventTypes, onEvent) {
+  const source = new EventSource(`${api.defaults.baseURL}/events`, { withCredentials: true });
+  [...eventTypes, 'resync'].forEach((type) => {
+    source.addEventListener(type, (e) => onEvent(type, JSON.parse(e.data)));
+  });
+  return () => source.close();
+}
+
 export default api;
\ No newline at end of file
@@ -1,5 +1,5 @@
 import React, { useState, useEffect, useContext } from 'react';
-import api from '../api/api';
+import api, { subscribeToEvents } from '../api/api';
 import { AuthContext } from '../App';
 import { useNavigate } from 'react-router-dom';
 
@@ -28,6 +28,9 @@ function CoordinatorDashboard() {
             }
         };
         fetchCoordinatorData();
+
+        // Refetch when the server pushes a relevant change instead of polling
+        return subscribeToEvents(['evaluation_submitted', 'internship_applied', 'term_archived'], () => fetchCoordinatorData());
     }, [auth, navigate]);
 
     if (!auth || !auth.isAuthenticated) {
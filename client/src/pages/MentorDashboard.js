@@ -1,5 +1,5 @@
 import React, { useState, useEffect, useContext } from 'react';
-import api from '../api/api';
+import api, { subscribeToEvents } from '../api/api';
 import { AuthContext } from '../App';
 import { useNavigate } from 'react-router-dom';
 import { motion } from 'framer-motion';
@@ -31,6 +31,9 @@ function MentorDashboard() {
             }
         };
         fetchMentorData();
+
+        // Refetch when the server pushes a relevant change instead of polling
+        return subscribeToEvents(['evaluation_submitted', 'internship_applied'], () => fetchMentorData());
     }, [auth, navigate]);
 
     if (!auth || !auth.isAuthenticated) {
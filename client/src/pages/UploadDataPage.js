@@ -6,6 +6,8 @@ function UploadDataPage() {
     const [selectedFile, setSelectedFile] = useState(null);
     const [message, setMessage] = useState('');
     const [messageType, setMessageType] = useState(''); // 'success' or 'error'
+    const [reportId, setReportId] = useState(null); // id of the rejected-rows report, if any
+    const [diffMode, setDiffMode] = useState(false); // only write new or changed rows
 
     const handleFileChange = (event) => {
         setSelectedFile(event.target.files[0]);
@@ -17,6 +19,7 @@ function UploadDataPage() {
         event.preventDefault();
         setMessage('');
         setMessageType('');
+        setReportId(null);
 
         if (!selectedFile) {
             setMessage('Please select a file to upload.');
@@ -26,6 +29,7 @@ function UploadDataPage() {
 
         const formData = new FormData();
         formData.append('file', selectedFile);
+        formData.append('mode', diffMode ? 'diff' : 'upsert');
 
         try {
             const response = await api.post('/upload_data', formData, {
@@ -35,10 +39,12 @@ function UploadDataPage() {
             });
             setMessage(response.data.message);
             setMessageType('success');
+            setReportId(response.data.report_id || null);
             setSelectedFile(null); // Clear selected file
         } catch (err) {
             setMessage(err.response?.data?.message || 'File upload failed.');
             setMessageType('error');
+            setReportId(err.response?.data?.report_id || null);
             console.error('Upload error:', err);
         }
     };
@@ -51,6 +57,11 @@ function UploadDataPage() {
             {message && (
                 <div className={`p-4 mb-4 text-sm rounded-lg ${messageType === 'success' ? 'bg-green-100 text-green-700' : 'bg-red-100 text-red-700'}`} role="alert">
                     {message}
+                    {reportId && (
+                        <a href={`${api.defaults.baseURL}/upload_report/${reportId}`} className="block mt-2 text-blue-600 hover:underline">
+                            Download rejected rows report
+                        </a>
+                    )}
                 </div>
             )}
 
@@ -70,6 +81,17 @@ function UploadDataPage() {
                         accept=".csv, .xlsx"
                     />
                 </div>
+                <div className="mb-4">
+                    <label className="inline-flex items-center text-gray-700 text-sm">
+                        <input
+                            type="checkbox"
+                            checked={diffMode}
+                            onChange={(e) => setDiffMode(e.target.checked)}
+                            className="mr-2"
+                        />
+                        Only update changed rows (faster for re-uploads of the full roster)
+                    </label>
+                </div>
                 <button type="submit" className="bg-green-500 hover:bg-green-700 text-white font-bold py-2 px-4 rounded focus:outline-none focus:shadow-outline">
                     Upload
                 </button>
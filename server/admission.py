@@ -0,0 +1,97 @@
+import math
+import threading
+import time
+from collections import deque
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request cannot be admitted; retry_after is a hint in whole seconds."""
+
+    def __init__(self, reason, retry_after):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class ConcurrencyLimiter:
+    """Caps concurrent requests of one endpoint class with a bounded FIFO wait queue.
+
+    per_user_limit bounds how many running plus queued requests a single user may hold,
+    so one user cannot fill the queue and starve the others.
+    """
+
+    def __init__(self, max_concurrent, max_queue=0, max_wait=0.0, per_user_limit=None):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.per_user_limit = per_user_limit
+        self._active = 0
+        self._waiters = deque()
+        self._per_user = {}
+        self._cond = threading.Condition()
+        # Moving average of how long a slot is held, used for the Retry-After hint
+        self._avg_hold = 1.0
+        self._started = {}
+
+    def _retry_after(self):
+        waves = (len(self._waiters) + 1) / max(self.max_concurrent, 1)
+        return max(1, math.ceil(self._avg_hold * waves))
+
+    def _user_enter(self, user):
+        self._per_user[user] = self._per_user.get(user, 0) + 1
+
+    def _user_leave(self, user):
+        remaining = self._per_user.get(user, 0) - 1
+        if remaining > 0:
+            self._per_user[user] = remaining
+        else:
+            self._per_user.pop(user, None)
+
+    def acquire(self, user):
+        """Take a slot for user, waiting in the queue if allowed; raises AdmissionRejected otherwise."""
+        with self._cond:
+            if self.per_user_limit is not None and self._per_user.get(user, 0) >= self.per_user_limit:
+                raise AdmissionRejected("Too many concurrent requests for this user", self._retry_after())
+            if self._active < self.max_concurrent and not self._waiters:
+                return self._admit(user)
+            if len(self._waiters) >= self.max_queue:
+                raise AdmissionRejected("Server busy, request queue is full", self._retry_after())
+
+            ticket = object()
+            self._waiters.append(ticket)
+            self._user_enter(user)
+            deadline = time.monotonic() + self.max_wait
+            try:
+                while self._waiters[0] is not ticket or self._active >= self.max_concurrent:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise AdmissionRejected("Server busy, timed out waiting for a slot", self._retry_after())
+                    self._cond.wait(remaining)
+            except AdmissionRejected:
+                self._waiters.remove(ticket)
+                self._user_leave(user)
+                self._cond.notify_all()
+                raise
+            self._waiters.popleft()
+            self._user_leave(user)
+            return self._admit(user)
+
+    def _admit(self, user):
+        self._active += 1
+        self._user_enter(user)
+        token = object()
+        self._started[token] = time.monotonic()
+        return token
+
+    def release(self, user, token):
+        with self._cond:
+            held = time.monotonic() - self._started.pop(token, time.monotonic())
+            self._avg_hold = 0.8 * self._avg_hold + 0.2 * held
+            self._active -= 1
+            self._user_leave(user)
+            self._cond.notify_all()
+
+    def stats(self):
+        with self._cond:
+            return {"active": self._active, "queued": len(self._waiters), "max_concurrent": self.max_concurrent,
+                    "max_queue": self.max_queue}
@@ -1,13 +1,27 @@
 import os
-from flask import Flask, request, jsonify, session, make_response
+from flask import Flask, request, jsonify, session, make_response, Response, g
 from flask_cors import CORS
 import mysql.connector
-import pandas as pd
 from werkzeug.utils import secure_filename
 from dotenv import load_dotenv
+from events import EventBus, create_backend
+from admission import ConcurrencyLimiter, AdmissionRejected
+from profiling import SamplingProfiler
+from resultset import ResultBuffer
 import io # Import io module for in-memory file operations
+import csv
+import json
+import re
+import hashlib
+import threading
+import time
+import uuid
 from functools import wraps # Import wraps for decorators
 
+# pandas (and NumPy with it) is imported lazily inside the upload functions only: importing it
+# here would add hundreds of milliseconds and tens of MB to every worker start. bench_startup.py
+# measures the cold-start budget.
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -16,6 +30,7 @@ CORS(app,
      resources={r"/api/*": {"origins": ["http://localhost:3000", "http://localhost:3001", "http://localhost:3002", "http://localhost:3005"]}},
      supports_credentials=True,
      allow_headers=["Content-Type", "Authorization"],
+     expose_headers=["X-Sync-Token", "Retry-After"],
      methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
 app.secret_key = os.getenv('FLASK_SECRET_KEY')
 
@@ -25,6 +40,10 @@ os.makedirs(UPLOAD_FOLDER, exist_ok=True) # Ensure the uploads folder exists
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 ALLOWED_EXTENSIONS = {'csv', 'xlsx'}
 
+# Live dashboard updates: in-process by default, set EVENT_BUS_URL=redis://... to share across workers
+event_bus = EventBus(create_backend(os.getenv('EVENT_BUS_URL')))
+SSE_HEARTBEAT_SECONDS = 15
+
 # Database connection function
 def get_db_connection():
     try:
@@ -40,6 +59,16 @@ def get_db_connection():
         print(f"Database connection error: {err}")
         return None
 
+# Max values bound into a single "IN (...)" list
+IN_CLAUSE_CHUNK_SIZE = 1000
+
+def in_clause_chunks(values):
+    """Yield (chunk, placeholders) pairs for running "col IN (...)" queries over values in bounded batches."""
+    values = list(values)
+    for start in range(0, len(values), IN_CLAUSE_CHUNK_SIZE):
+        chunk = tuple(values[start:start + IN_CLAUSE_CHUNK_SIZE])
+        yield chunk, ', '.join(['%s'] * len(chunk))
+
 def allowed_file(filename):
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -63,6 +92,266 @@ def role_required(roles):
         return decorated_function
     return decorator
 
+# Admission control: heavy endpoints (imports, exports, report queries) share a small
+# number of slots with a bounded wait queue, so they cannot take every worker and DB
+# connection away from the interactive dashboards, which are never limited here.
+ADMISSION_LIMITERS = {
+    'heavy': ConcurrencyLimiter(
+        max_concurrent=int(os.getenv('HEAVY_MAX_CONCURRENT', 2)),
+        max_queue=int(os.getenv('HEAVY_MAX_QUEUE', 4)),
+        max_wait=float(os.getenv('HEAVY_MAX_WAIT_SECONDS', 10)),
+        # Below max_concurrent, so one user can never hold every heavy slot
+        per_user_limit=int(os.getenv('HEAVY_PER_USER_LIMIT', 1)),
+    ),
+    # Each open SSE stream holds a worker thread for its whole lifetime
+    'stream': ConcurrencyLimiter(
+        max_concurrent=int(os.getenv('STREAM_MAX_CONCURRENT', 100)),
+        per_user_limit=int(os.getenv('STREAM_PER_USER_LIMIT', 5)),
+    ),
+}
+
+def admission_control(endpoint_class):
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            limiter = ADMISSION_LIMITERS[endpoint_class]
+            user = session.get('ssn')
+            try:
+                token = limiter.acquire(user)
+            except AdmissionRejected as rejection:
+                response = jsonify({"message": f"{rejection.reason}. Please retry later."})
+                response.headers['Retry-After'] = str(rejection.retry_after)
+                return response, 429
+            try:
+                response = make_response(f(*args, **kwargs))
+            except BaseException:
+                limiter.release(user, token)
+                raise
+            if response.is_streamed:
+                # Streamed bodies are produced after we return: hold the slot until the stream closes
+                response.call_on_close(lambda: limiter.release(user, token))
+            else:
+                limiter.release(user, token)
+            return response
+        return decorated_function
+    return decorator
+
+# --- Request Profiling ---
+# Off by default; an admin enables it through /api/profiling with a sample rate. While off,
+# the only per-request cost is the enabled check in start_request_profile().
+profiler = SamplingProfiler(os.path.dirname(os.path.abspath(__file__)))
+UNPROFILED_ENDPOINTS = {'profiling_settings', 'profiling_routes', 'profiling_flamegraph', 'events_stream'}
+
+@app.before_request
+def start_request_profile():
+    if profiler.should_profile() and request.endpoint and request.endpoint not in UNPROFILED_ENDPOINTS:
+        g.profile_token = profiler.begin(request.endpoint)
+
+@app.teardown_request
+def end_request_profile(exc):
+    token = g.pop('profile_token', None)
+    if token is not None:
+        profiler.end(token)
+
+@app.route('/api/profiling', methods=['GET', 'POST', 'DELETE'])
+@login_required
+@role_required(['Admin'])
+def profiling_settings():
+    if request.method == 'DELETE':
+        profiler.reset()
+        return jsonify({"message": "Profiling data cleared."}), 200
+    if request.method == 'POST':
+        data = request.get_json() or {}
+        try:
+            profiler.configure(
+                enabled=bool(data['enabled']) if 'enabled' in data else None,
+                sample_rate=float(data['sample_rate']) if 'sample_rate' in data else None,
+                interval=float(data['interval_seconds']) if 'interval_seconds' in data else None,
+            )
+        except (TypeError, ValueError) as err:
+            return jsonify({"message": f"Invalid profiling settings: {err}"}), 400
+    return jsonify(profiler.settings()), 200
+
+@app.route('/api/profiling/routes', methods=['GET'])
+@login_required
+@role_required(['Admin'])
+def profiling_routes():
+    return jsonify(profiler.routes_summary()), 200
+
+@app.route('/api/profiling/flamegraph', methods=['GET'])
+@login_required
+@role_required(['Admin'])
+def profiling_flamegraph():
+    route = request.args.get('route')
+    response = make_response(profiler.collapsed_stacks(route))
+    response.headers["Content-Disposition"] = f"attachment; filename={route or 'all_routes'}.collapsed"
+    response.headers["Content-type"] = "text/plain"
+    return response
+
+# --- Delta Sync ---
+# List endpoints accept ?since=<token> and then return only the rows whose key was
+# touched after that token, as {"token", "changed_keys", "rows"}. Clients drop their
+# cached rows for every changed key and add the returned rows; keys without rows were
+# deleted. Full responses carry the current token in the X-Sync-Token header.
+def parse_since_token():
+    """Return the ?since= token as an int, None when absent; raises ValueError if malformed."""
+    since = request.args.get('since')
+    if since is None:
+        return None
+    if not since.isdigit():
+        raise ValueError(f"Invalid since token '{since}'")
+    return int(since)
+
+# change_ids are taken at insert time but become visible at commit, so MAX(change_id) can be
+# ahead of a smaller id still held by an open transaction. The token is instead the newest
+# change taken before every open write transaction started (innodb_trx, which needs the PROCESS
+# privilege), less a margin for trx_started's one-second precision. Re-sending a change is
+# harmless: clients replace the rows of every changed key.
+SYNC_TOKEN_SAFETY_SECONDS = 2
+# Without PROCESS the open transactions cannot be seen; the token then lags by a fixed margin
+# that must exceed the longest write transaction (uploads, ArchiveTerm).
+SYNC_TOKEN_FALLBACK_LAG_SECONDS = int(os.getenv('SYNC_TOKEN_FALLBACK_LAG_SECONDS', 3600))
+SYNC_TOKEN_PRIVILEGE_ERRORS = (1142, 1227) # ER_TABLEACCESS_DENIED_ERROR, ER_SPECIFIC_ACCESS_DENIED_ERROR
+sync_token_sees_transactions = True
+
+def get_sync_token(conn):
+    """Highest change_id below which every change is committed (read before the data so no change is missed)."""
+    global sync_token_sees_transactions
+    cursor = conn.cursor()
+    try:
+        if sync_token_sees_transactions:
+            try:
+                cursor.execute("""
+                    SELECT change_id FROM ChangeLog
+                    WHERE changed_at < (SELECT LEAST(NOW(6), COALESCE(MIN(trx_started), NOW(6)))
+                                        FROM information_schema.innodb_trx WHERE trx_rows_modified > 0)
+                                       - INTERVAL %s SECOND
+                    ORDER BY change_id DESC LIMIT 1
+                """, (SYNC_TOKEN_SAFETY_SECONDS,))
+                row = cursor.fetchone()
+                return str(row[0] if row else 0)
+            except mysql.connector.Error as err:
+                if err.errno not in SYNC_TOKEN_PRIVILEGE_ERRORS:
+                    raise
+                sync_token_sees_transactions = False
+                app.logger.warning("Cannot read information_schema.innodb_trx (grant PROCESS to the database user); "
+                                   f"sync tokens now lag by {SYNC_TOKEN_FALLBACK_LAG_SECONDS} seconds: {err}")
+        cursor.execute("""
+            SELECT change_id FROM ChangeLog WHERE changed_at < NOW(6) - INTERVAL %s SECOND
+            ORDER BY change_id DESC LIMIT 1
+        """, (SYNC_TOKEN_FALLBACK_LAG_SECONDS,))
+        row = cursor.fetchone()
+        return str(row[0] if row else 0)
+    finally:
+        cursor.close()
+
+def fetch_changed_keys(conn, tables, key_column, since):
+    """Distinct ChangeLog keys (row_key or student_id) touched in tables after since."""
+    cursor = conn.cursor()
+    try:
+        placeholders = ', '.join(['%s'] * len(tables))
+        cursor.execute(f"""
+            SELECT DISTINCT {key_column} FROM ChangeLog
+            WHERE change_id > %s AND table_name IN ({placeholders}) AND {key_column} IS NOT NULL
+        """, (since, *tables))
+        return [row[0] for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+def fetch_delta(conn, cursor, select_sql, key, since, tables, key_column='student_id', params=()):
+    """(changed_keys, ResultBuffer of the select_sql rows whose key changed after since)."""
+    changed_keys = fetch_changed_keys(conn, tables, key_column, since)
+    result = None
+    for chunk, placeholders in in_clause_chunks(changed_keys):
+        cursor.execute(f"SELECT * FROM ({select_sql}) AS scoped WHERE {key} IN ({placeholders})", params + chunk)
+        chunk_result = ResultBuffer.fetch(cursor)
+        if result is None:
+            result = chunk_result
+        else:
+            result.extend(chunk_result)
+    return changed_keys, result or ResultBuffer((), [])
+
+def encode_result(result):
+    """Serialize a ResultBuffer as objects (default) or, with ?format=compact, as columns + row arrays."""
+    if request.args.get('format') == 'compact':
+        return result.to_compact_json(default=app.json.default)
+    return result.to_json(default=app.json.default)
+
+def sync_token_expired(conn, since):
+    """True if PruneChangeLog already deleted changes newer than since, so the delta would be incomplete."""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT MIN(change_id) FROM ChangeLog")
+        oldest = cursor.fetchone()[0]
+        # Rows up to oldest - 1 may have been pruned; a token at or past that point is still complete
+        return oldest is not None and since < oldest - 1
+    finally:
+        cursor.close()
+
+def sync_response(conn, cursor, select_sql, key, since, tables, key_column='student_id', params=()):
+    """(response, status) for the full list or ?since= delta of select_sql, tagged with the current sync token.
+
+    cursor must be a plain (tuple) cursor: rows are kept as tuples and encoded straight
+    to JSON instead of going through one dict per row and jsonify(). A since token older
+    than the retained ChangeLog gets 410, telling the client to reload the full list.
+    """
+    if since is not None and sync_token_expired(conn, since):
+        return jsonify({"message": "Sync token expired. Reload the full list without 'since'."}), 410
+    token = get_sync_token(conn)
+    if since is None:
+        cursor.execute(select_sql, params)
+        body = encode_result(ResultBuffer.fetch(cursor))
+    else:
+        changed_keys, result = fetch_delta(conn, cursor, select_sql, key, since, tables, key_column, params)
+        # Keys in sorted order, as jsonify() would write them
+        body = (f'{{"changed_keys":{json.dumps(changed_keys, default=app.json.default)},'
+                f'"rows":{encode_result(result)},"token":{json.dumps(token)}}}')
+    response = app.response_class(body + '\n', mimetype=app.json.mimetype)
+    response.headers['X-Sync-Token'] = token
+    return response, 200
+
+# --- Term Scoping ---
+# Internship, StudentInternship and Evaluation rows belong to a Term. Reads default to the
+# active term; ?term_id=<id> selects one term and ?history=1 opts into every term, which then
+# also reads the archive tables filled by ArchiveTerm. The internal 'live' scope covers every
+# term still in the live tables (what CountFailingStudents used to count).
+ACTIVE_TERM_SQL = "(SELECT term_id FROM Term WHERE status = 'Active')"
+
+# Scopes that never reach an archived term, so the archive tables can be skipped
+LIVE_ONLY_SCOPES = ('active', 'live')
+
+def parse_term_scope():
+    """Return ('active', None), ('term', term_id) or ('history', None); raises ValueError if malformed."""
+    if request.args.get('history') in ('1', 'true'):
+        return ('history', None)
+    term_id = request.args.get('term_id')
+    if term_id is None:
+        return ('active', None)
+    if not term_id.isdigit():
+        raise ValueError(f"Invalid term_id '{term_id}'")
+    return ('term', int(term_id))
+
+def term_condition(column, scope):
+    """SQL condition (and its params) restricting column to the requested term scope."""
+    kind, term_id = scope
+    if kind in ('history', 'live'):
+        return "1 = 1", ()
+    if kind == 'term':
+        return f"{column} = %s", (term_id,)
+    return f"{column} IN {ACTIVE_TERM_SQL}", ()
+
+def term_scoped_table(table, archive_table, scope):
+    """table to select from for scope: the live table alone for the active term, else live plus archived rows."""
+    if scope[0] in LIVE_ONLY_SCOPES:
+        return table
+    return f"(SELECT * FROM {table} UNION ALL SELECT * FROM {archive_table})"
+
+def term_scoped_view(view, archive_view, scope):
+    """SELECT over view restricted to scope, adding the archived rows unless only the active term is wanted."""
+    source = view if scope[0] in LIVE_ONLY_SCOPES else f"(SELECT * FROM {view} UNION ALL SELECT * FROM {archive_view}) AS terms"
+    condition, params = term_condition('term_id', scope)
+    return f"SELECT * FROM {source} WHERE {condition}", params
+
 # --- API Routes ---
 
 @app.route('/api/login', methods=['POST'])
@@ -127,19 +416,57 @@ def check_auth():
         return jsonify({"isAuthenticated": True, "ssn": session['ssn'], "role": session['role']}), 200
     return jsonify({"isAuthenticated": False}), 200
 
+# --- Live Updates (Server-Sent Events) ---
+def publish_event(event, roles):
+    """Notify dashboards after a commit; a failing event backend must not fail the write.
+
+    Events carry no data: every subscriber of a role gets them, and login is by SSN, so an id
+    in the payload would leak one user's credential to others. Dashboards just refetch.
+    """
+    try:
+        event_bus.publish(event, {}, roles)
+    except Exception as e:
+        app.logger.error(f"Failed to publish '{event}' event: {e}")
+
+@app.route('/api/events', methods=['GET'])
+@login_required
+@admission_control('stream')
+def events_stream():
+    role = session['role']
+    subscription = event_bus.subscribe(role)
+
+    def stream():
+        try:
+            yield ": connected\n\n"
+            while True:
+                frame = subscription.get(timeout=SSE_HEARTBEAT_SECONDS)
+                # Comment lines keep proxies from closing an idle stream
+                yield frame if frame is not None else ": keepalive\n\n"
+        finally:
+            event_bus.unsubscribe(role, subscription)
+
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 # --- User-specific dashboards/data ---
 @app.route('/api/admin_dashboard_data', methods=['GET'])
 @login_required
 @role_required(['Admin'])
 def admin_dashboard_data():
+    try:
+        since = parse_since_token()
+        scope = parse_term_scope()
+    except ValueError as err:
+        return jsonify({"message": str(err)}), 400
+
     conn = get_db_connection()
     if not conn: return jsonify({"message": "Database connection error"}), 500
 
-    cursor = conn.cursor(dictionary=True)
+    cursor = conn.cursor()
     try:
-        cursor.execute("SELECT * FROM AdminView")
-        data = cursor.fetchall()
-        return jsonify(data), 200
+        select_sql, params = term_scoped_view('AdminView', 'AdminArchiveView', scope)
+        return sync_response(conn, cursor, select_sql, 'student_id', since,
+                             ('User', 'Internship', 'Evaluation'), params=params)
     except mysql.connector.Error as err:
         return jsonify({"message": f"Error fetching admin data: {err}"}), 500
     finally:
@@ -151,21 +478,30 @@ def admin_dashboard_data():
 @role_required(['Student'])
 def student_dashboard_data():
     ssn = session['ssn']
+    try:
+        scope = parse_term_scope()
+    except ValueError as err:
+        return jsonify({"message": str(err)}), 400
+    internship_term, term_params = term_condition('i.term_id', scope)
+    evaluation_term, _ = term_condition('e.term_id', scope)
+    internships = term_scoped_table('Internship', 'InternshipArchive', scope)
+    evaluations = term_scoped_table('Evaluation', 'EvaluationArchive', scope)
+
     conn = get_db_connection()
     if not conn: return jsonify({"message": "Database connection error"}), 500
 
     cursor = conn.cursor(dictionary=True)
     try:
-        cursor.execute("""
+        cursor.execute(f"""
             SELECT s.ssn, u.name as full_name, u.email, e.final_grade as grade,
                    i.company_name, m.position as mentor_position, m.type as mentor_type
             FROM Student s
             JOIN User u ON s.ssn = u.ssn
-            LEFT JOIN Internship i ON s.ssn = i.s_id
+            LEFT JOIN {internships} i ON s.ssn = i.s_id AND {internship_term}
             LEFT JOIN Mentor m ON s.m_id = m.m_id
-            LEFT JOIN Evaluation e ON s.ssn = e.s_id
+            LEFT JOIN {evaluations} e ON s.ssn = e.s_id AND {evaluation_term}
             WHERE s.ssn = %s
-        """, (ssn,))
+        """, term_params + term_params + (ssn,))
         data = cursor.fetchall()
         return jsonify(data), 200
     except mysql.connector.Error as err:
@@ -178,14 +514,20 @@ def student_dashboard_data():
 @login_required
 @role_required(['InternshipCoordinator'])
 def coordinator_dashboard_data():
+    try:
+        since = parse_since_token()
+        scope = parse_term_scope()
+    except ValueError as err:
+        return jsonify({"message": str(err)}), 400
+
     conn = get_db_connection()
     if not conn: return jsonify({"message": "Database connection error"}), 500
 
-    cursor = conn.cursor(dictionary=True)
+    cursor = conn.cursor()
     try:
-        cursor.execute("SELECT * FROM CoordinatorView")
-        data = cursor.fetchall()
-        return jsonify(data), 200
+        select_sql, params = term_scoped_view('CoordinatorView', 'CoordinatorArchiveView', scope)
+        return sync_response(conn, cursor, select_sql, 'student_id', since,
+                             ('User', 'Internship', 'Evaluation'), params=params)
     except mysql.connector.Error as err:
         return jsonify({"message": f"Error fetching coordinator data: {err}"}), 500
     finally:
@@ -197,6 +539,15 @@ def coordinator_dashboard_data():
 @role_required(['Mentor'])
 def mentor_dashboard_data():
     ssn = session['ssn']
+    try:
+        scope = parse_term_scope()
+    except ValueError as err:
+        return jsonify({"message": str(err)}), 400
+    internship_term, term_params = term_condition('i.term_id', scope)
+    evaluation_term, _ = term_condition('e.term_id', scope)
+    internships = term_scoped_table('Internship', 'InternshipArchive', scope)
+    evaluations = term_scoped_table('Evaluation', 'EvaluationArchive', scope)
+
     conn = get_db_connection()
     if not conn: return jsonify({"message": "Database connection error"}), 500
 
@@ -211,17 +562,17 @@ def mentor_dashboard_data():
         mentor_info = cursor.fetchone() or {}
 
         # Then get assigned students information
-        cursor.execute("""
+        cursor.execute(f"""
             SELECT s.ssn, u.name as student_name, u.email as student_email,
                    i.company_name, i.start_date, i.end_date,
                    e.final_grade, e.comments
             FROM Mentor m
             JOIN Student s ON m.ssn = s.m_id
             JOIN User u ON s.ssn = u.ssn
-            LEFT JOIN Internship i ON s.ssn = i.s_id
-            LEFT JOIN Evaluation e ON s.ssn = e.s_id
+            LEFT JOIN {internships} i ON s.ssn = i.s_id AND {internship_term}
+            LEFT JOIN {evaluations} e ON s.ssn = e.s_id AND {evaluation_term}
             WHERE m.ssn = %s
-        """, (ssn,))
+        """, term_params + term_params + (ssn,))
         students_data = cursor.fetchall()
 
         # Combine the data
@@ -242,14 +593,18 @@ def mentor_dashboard_data():
 @login_required
 @role_required(['Admin'])
 def get_users():
+    try:
+        since = parse_since_token()
+    except ValueError as err:
+        return jsonify({"message": str(err)}), 400
+
     conn = get_db_connection()
     if not conn: return jsonify({"message": "Database connection error"}), 500
 
-    cursor = conn.cursor(dictionary=True)
+    cursor = conn.cursor()
     try:
-        cursor.execute("SELECT ssn, name, email, address, date_of_birth FROM User")
-        users = cursor.fetchall()
-        return jsonify(users), 200
+        return sync_response(conn, cursor, "SELECT ssn, name, email, address, date_of_birth FROM User", 'ssn', since,
+                             ('User',), key_column='row_key')
     except mysql.connector.Error as err:
         return jsonify({"message": f"Error fetching users: {err}"}), 500
     finally:
@@ -281,6 +636,7 @@ def add_user():
             (ssn, name, email, address, date_of_birth)
         )
         conn.commit()
+        publish_event('user_added', ['Admin'])
         return jsonify({"message": "User added successfully!"}), 201
     except mysql.connector.IntegrityError as err:
         conn.rollback()
@@ -292,11 +648,120 @@ def add_user():
         cursor.close()
         conn.close()
 
+# --- Search API ---
+SEARCH_TYPES = ('users', 'companies', 'comments')
+SEARCH_MAX_PER_PAGE = 50
+# InnoDB ignores full-text terms shorter than innodb_ft_min_token_size (3 by default)
+FULLTEXT_MIN_TERM_LENGTH = 3
+
+SEARCH_QUERIES = {
+    'users': """
+        SELECT ssn, name, email, MATCH(name, email) AGAINST (%s IN BOOLEAN MODE) AS score
+        FROM User
+        WHERE MATCH(name, email) AGAINST (%s IN BOOLEAN MODE)
+        ORDER BY score DESC, name
+        LIMIT %s OFFSET %s
+    """,
+    'companies': """
+        SELECT company_name, COUNT(*) AS internships,
+               MAX(MATCH(company_name) AGAINST (%s IN BOOLEAN MODE)) AS score
+        FROM Internship
+        WHERE MATCH(company_name) AGAINST (%s IN BOOLEAN MODE)
+        GROUP BY company_name
+        ORDER BY score DESC, company_name
+        LIMIT %s OFFSET %s
+    """,
+    'comments': """
+        SELECT ev_id, s_id AS student_id, final_grade, comments,
+               MATCH(comments) AGAINST (%s IN BOOLEAN MODE) AS score
+        FROM Evaluation
+        WHERE MATCH(comments) AGAINST (%s IN BOOLEAN MODE)
+        ORDER BY score DESC, ev_id
+        LIMIT %s OFFSET %s
+    """,
+}
+# Prefix lookups on the B-tree indexes, used when every term is too short for the full-text index:
+# (query, number of LIKE prefix parameters before LIMIT/OFFSET)
+SHORT_SEARCH_QUERIES = {
+    'users': ("SELECT ssn, name, email, 1 AS score FROM User WHERE name LIKE %s OR email LIKE %s ORDER BY name LIMIT %s OFFSET %s", 2),
+    'companies': ("""
+        SELECT company_name, COUNT(*) AS internships, 1 AS score FROM Internship
+        WHERE company_name LIKE %s
+        GROUP BY company_name ORDER BY company_name LIMIT %s OFFSET %s
+    """, 1),
+}
+
+def build_fulltext_query(q):
+    """Turn free text into a BOOLEAN MODE query requiring every word as a prefix ('+word*').
+
+    Returns None when no word is long enough for the full-text index.
+    """
+    words = re.sub(r'[+\-<>()~*"@]', ' ', q).split()
+    words = [word for word in words if len(word) >= FULLTEXT_MIN_TERM_LENGTH]
+    if not words:
+        return None
+    return ' '.join(f'+{word}*' for word in words)
+
+@app.route('/api/search', methods=['GET'])
+@login_required
+@role_required(['Admin', 'InternshipCoordinator'])
+def search():
+    q = request.args.get('q', '').strip()
+    if not q:
+        return jsonify({"message": "Search query 'q' is required."}), 400
+
+    search_type = request.args.get('type', 'all')
+    if search_type != 'all' and search_type not in SEARCH_TYPES:
+        return jsonify({"message": f"Invalid search type. Use 'all' or one of: {', '.join(SEARCH_TYPES)}."}), 400
+    types = SEARCH_TYPES if search_type == 'all' else (search_type,)
+
+    try:
+        page = max(int(request.args.get('page', 1)), 1)
+        per_page = min(max(int(request.args.get('per_page', 20)), 1), SEARCH_MAX_PER_PAGE)
+    except ValueError:
+        return jsonify({"message": "page and per_page must be integers."}), 400
+    offset = (page - 1) * per_page
+
+    fulltext_query = build_fulltext_query(q)
+    conn = get_db_connection()
+    if not conn: return jsonify({"message": "Database connection error"}), 500
+
+    cursor = conn.cursor(dictionary=True)
+    results = {}
+    try:
+        for result_type in types:
+            if fulltext_query:
+                cursor.execute(SEARCH_QUERIES[result_type], (fulltext_query, fulltext_query, per_page, offset))
+                results[result_type] = cursor.fetchall()
+            elif result_type in SHORT_SEARCH_QUERIES:
+                prefix = re.sub(r'([%_\\])', r'\\\1', q) + '%'
+                short_query, prefix_params = SHORT_SEARCH_QUERIES[result_type]
+                cursor.execute(short_query, (prefix,) * prefix_params + (per_page, offset))
+                results[result_type] = cursor.fetchall()
+            else:
+                results[result_type] = [] # Keyword search over comments needs at least one full word
+        return jsonify({"query": q, "page": page, "per_page": per_page, "results": results}), 200
+    except mysql.connector.Error as err:
+        return jsonify({"message": f"Error running search: {err}"}), 500
+    finally:
+        cursor.close()
+        conn.close()
+
 # --- Business Queries API ---
 @app.route('/api/business_queries', methods=['GET'])
 @login_required
 @role_required(['Admin'])
+@admission_control('heavy')
 def get_business_queries():
+    try:
+        scope = parse_term_scope()
+    except ValueError as err:
+        return jsonify({"message": str(err)}), 400
+    evaluation_term, term_params = term_condition('e.term_id', scope)
+    internship_term, _ = term_condition('i.term_id', scope)
+    evaluations = term_scoped_table('Evaluation', 'EvaluationArchive', scope)
+    internships = term_scoped_table('Internship', 'InternshipArchive', scope)
+
     conn = get_db_connection()
     if not conn: return jsonify({"message": "Database connection error"}), 500
 
@@ -305,49 +770,53 @@ def get_business_queries():
 
     try:
         # 1. Internship with highest grade
-        cursor.execute("""
+        cursor.execute(f"""
             SELECT i.company_name, MAX(e.final_grade) AS highest_grade
-            FROM Evaluation e JOIN Internship i ON e.s_id = i.s_id
+            FROM {evaluations} e JOIN {internships} i ON e.s_id = i.s_id AND i.term_id = e.term_id
+            WHERE {evaluation_term}
             GROUP BY i.company_name ORDER BY highest_grade DESC LIMIT 1;
-        """)
+        """, term_params)
         results['highest_grade_internship'] = cursor.fetchone()
 
         # 2. Most selected mentor by high-score students
-        cursor.execute("""
+        cursor.execute(f"""
             SELECT m.position, COUNT(*) AS count
-            FROM Mentor m JOIN Student s ON m.m_id = s.m_id JOIN Evaluation e ON s.student_id = e.s_id
-            WHERE e.final_grade IN ('A', 'A+') GROUP BY m.position ORDER BY count DESC;
-        """)
+            FROM Mentor m JOIN Student s ON m.m_id = s.m_id JOIN {evaluations} e ON s.student_id = e.s_id
+            WHERE e.final_grade IN ('A', 'A+') AND {evaluation_term} GROUP BY m.position ORDER BY count DESC;
+        """, term_params)
         results['most_selected_mentor'] = cursor.fetchall()
 
         # 3. Number of students per internship coordinator
-        cursor.execute("""
+        cursor.execute(f"""
             SELECT ic.name AS coordinator_name, COUNT(DISTINCT s.student_id) AS total_students
-            FROM InternshipCoordinator ic JOIN Internship i ON ic.ic_id = i.ic_id JOIN Student s ON i.s_id = s.student_id
+            FROM InternshipCoordinator ic JOIN {internships} i ON ic.ic_id = i.ic_id JOIN Student s ON i.s_id = s.student_id
+            WHERE {internship_term}
             GROUP BY ic.name;
-        """)
+        """, term_params)
         results['students_per_coordinator'] = cursor.fetchall()
 
         # 4. External evaluations and internal mentor guidance
-        cursor.execute("""
+        cursor.execute(f"""
             SELECT s.student_id, e.comments AS evaluation, m.position AS mentor_position
-            FROM Student s JOIN Evaluation e ON s.student_id = e.s_id JOIN Mentor m ON s.m_id = m.m_id;
-        """)
+            FROM Student s JOIN {evaluations} e ON s.student_id = e.s_id JOIN Mentor m ON s.m_id = m.m_id
+            WHERE {evaluation_term};
+        """, term_params)
         results['evaluations_mentor_guidance'] = cursor.fetchall()
 
         # 5. Internship duration and reports per company
-        cursor.execute("""
+        cursor.execute(f"""
             SELECT i.company_name, DATEDIFF(i.end_date, i.start_date) AS duration, COUNT(e.final_grade) AS reports
-            FROM Internship i JOIN Evaluation e ON i.s_id = e.s_id GROUP BY i.company_name;
-        """)
+            FROM {internships} i JOIN {evaluations} e ON i.s_id = e.s_id AND e.term_id = i.term_id
+            WHERE {internship_term} GROUP BY i.company_name;
+        """, term_params)
         results['internship_duration_reports'] = cursor.fetchall()
 
         # 6. Students with low grades to be warned
-        cursor.execute("""
+        cursor.execute(f"""
             SELECT s.student_id, u.name, e.final_grade
-            FROM Student s JOIN Evaluation e ON s.student_id = e.s_id JOIN User u ON s.ssn = u.ssn
-            WHERE e.final_grade IN ('D', 'F');
-        """)
+            FROM Student s JOIN {evaluations} e ON s.student_id = e.s_id JOIN User u ON s.ssn = u.ssn
+            WHERE e.final_grade IN ('D', 'F') AND {evaluation_term};
+        """, term_params)
         results['low_grade_students'] = cursor.fetchall()
 
         return jsonify(results), 200
@@ -361,7 +830,15 @@ def get_business_queries():
 @app.route('/api/export_report/<string:report_name>', methods=['GET'])
 @login_required
 @role_required(['Admin'])
+@admission_control('heavy')
 def export_report(report_name):
+    try:
+        scope = parse_term_scope()
+    except ValueError as err:
+        return jsonify({"message": str(err)}), 400
+    evaluation_term, term_params = term_condition('e.term_id', scope)
+    evaluations = term_scoped_table('Evaluation', 'EvaluationArchive', scope)
+
     conn = get_db_connection()
     if not conn: return jsonify({"message": "Database connection error"}), 500
 
@@ -370,24 +847,23 @@ def export_report(report_name):
 
     try:
         if report_name == 'low_grade_students':
-            cursor.execute("""
+            cursor.execute(f"""
                 SELECT s.student_id, u.name, e.final_grade
-                FROM Student s JOIN Evaluation e ON s.student_id = e.s_id JOIN User u ON s.ssn = u.ssn
-                WHERE e.final_grade IN ('D', 'F');
-            """)
+                FROM Student s JOIN {evaluations} e ON s.student_id = e.s_id JOIN User u ON s.ssn = u.ssn
+                WHERE e.final_grade IN ('D', 'F') AND {evaluation_term};
+            """, term_params)
             data = cursor.fetchall()
         else:
             return jsonify({"message": "Invalid report name for export"}), 400
 
         if data:
-            df = pd.DataFrame(data)
-            # Use BytesIO to create an in-memory file for sending
-            csv_buffer = io.BytesIO()
-            df.to_csv(csv_buffer, index=False, encoding='utf-8')
-            csv_buffer.seek(0)
+            # Plain csv writer: exports do not need pandas loaded
+            csv_buffer = io.StringIO()
+            writer = csv.DictWriter(csv_buffer, fieldnames=list(data[0]), lineterminator='\n')
+            writer.writeheader()
+            writer.writerows(data)
             
-            # Flask's send_file can directly return a file-like object
-            response = make_response(csv_buffer.getvalue())
+            response = make_response(csv_buffer.getvalue().encode('utf-8'))
             response.headers["Content-Disposition"] = f"attachment; filename={report_name}.csv"
             response.headers["Content-type"] = "text/csv"
             return response
@@ -402,10 +878,117 @@ def export_report(report_name):
         cursor.close()
         conn.close()
 
+# --- Upload Validation ---
+# Columns of the 'User' table accepted by /api/upload_data, in insert order.
+USER_UPLOAD_COLUMNS = ['ssn', 'name', 'email', 'address', 'date_of_birth']
+USER_REQUIRED_COLUMNS = ['ssn', 'name', 'email', 'date_of_birth']
+SSN_PATTERN = r'[A-Za-z0-9-]{1,20}'
+EMAIL_PATTERN = r'[^@\s]+@[^@\s]+\.[^@\s]+'
+
+# Rejected-row reports are written to UPLOAD_FOLDER, so any worker can serve the download,
+# and deleted once they are older than UPLOAD_REPORT_TTL_SECONDS.
+UPLOAD_REPORT_SUFFIX = '.errors.csv'
+UPLOAD_REPORT_TTL_SECONDS = 24 * 60 * 60
+
+def validate_user_rows(df):
+    """Validate an uploaded 'User' sheet in a single vectorized pass.
+
+    Returns (valid_df, rejected_df). valid_df holds the cleaned rows ready for
+    insertion (missing values as None, dates as YYYY-MM-DD). rejected_df has one
+    line per rejected row with its sheet row number, ssn and the list of errors.
+    """
+    import pandas as pd # Imported on first upload; see the note at the top of the file
+    text = pd.DataFrame({col: df[col].astype('string').str.strip() for col in USER_UPLOAD_COLUMNS})
+    text = text.mask(text.eq(''))
+    # Strict: partial dates ('2000', '2000-01') and timestamps are rejected, not filled in. Excel date
+    # cells read with dtype=str come out as 'YYYY-MM-DD 00:00:00', so a zero time part is dropped first.
+    birth_dates = text['date_of_birth'].str.replace(r' 00:00:00$', '', regex=True)
+    dates = pd.to_datetime(birth_dates, format='%Y-%m-%d', errors='coerce')
+    # User.ssn compares case-insensitively in MySQL, so 'u001' and 'U001' are the same user
+    ssn_keys = text['ssn'].str.upper()
+
+    checks = [(text[col].isna(), f"{col} is required") for col in USER_REQUIRED_COLUMNS]
+    checks += [
+        (text['ssn'].notna() & ~text['ssn'].str.fullmatch(SSN_PATTERN).fillna(False).astype(bool),
+         "ssn must be 1-20 letters, digits or dashes"),
+        (text['email'].notna() & ~text['email'].str.fullmatch(EMAIL_PATTERN).fillna(False).astype(bool),
+         "email is not a valid address"),
+        (text['date_of_birth'].notna() & dates.isna(), "date_of_birth is not a valid date (YYYY-MM-DD)"),
+        (text['ssn'].notna() & ssn_keys.duplicated(keep=False), "ssn appears more than once in the file"),
+    ]
+    rejected_mask = pd.Series(False, index=df.index)
+    for mask, _ in checks:
+        rejected_mask |= mask
+
+    # Build error strings only for the rejected subset.
+    errors = pd.Series('', index=df.index[rejected_mask], dtype=object)
+    for mask, message in checks:
+        hit = mask[rejected_mask]
+        errors[hit] = errors[hit] + message + '; '
+    rejected = pd.DataFrame({
+        'row': df.index[rejected_mask] + 2, # +1 for the header line, +1 for 1-based numbering
+        'ssn': text['ssn'][rejected_mask].fillna('').astype(object),
+        'errors': errors.str.rstrip('; '),
+    })
+
+    valid = text[~rejected_mask].copy()
+    valid['date_of_birth'] = dates[~rejected_mask].dt.strftime('%Y-%m-%d')
+    valid = valid.astype(object).where(valid.notna(), None)
+    return valid, rejected
+
+def upload_report_path(report_id):
+    """File of an upload report, or None if report_id is not one of our ids."""
+    if not re.fullmatch(r'[0-9a-f]{32}', report_id):
+        return None
+    return os.path.join(app.config['UPLOAD_FOLDER'], report_id + UPLOAD_REPORT_SUFFIX)
+
+def prune_upload_reports():
+    """Delete upload reports older than UPLOAD_REPORT_TTL_SECONDS."""
+    cutoff = time.time() - UPLOAD_REPORT_TTL_SECONDS
+    for name in os.listdir(app.config['UPLOAD_FOLDER']):
+        if not name.endswith(UPLOAD_REPORT_SUFFIX):
+            continue
+        path = os.path.join(app.config['UPLOAD_FOLDER'], name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except FileNotFoundError:
+            pass # Removed by another worker meanwhile
+
+def store_upload_report(rejected):
+    """Write the rejected-row report to the upload folder and return the id used to download it."""
+    prune_upload_reports()
+    report_id = uuid.uuid4().hex
+    rejected.to_csv(upload_report_path(report_id), index=False)
+    return report_id
+
+# Content hash of a User row computed by MySQL; must stay in sync with user_fingerprint().
+# '%%' because the query is sent with parameters.
+USER_FINGERPRINT_SQL = (
+    "MD5(CONCAT_WS(CHAR(31 USING utf8mb4), IFNULL(name, ''), IFNULL(email, ''), IFNULL(address, ''), "
+    "IFNULL(DATE_FORMAT(date_of_birth, '%%Y-%%m-%%d'), '')))"
+)
+
+def user_fingerprint(row):
+    """Content hash of an upload row (ssn, name, email, address, date_of_birth), matching USER_FINGERPRINT_SQL."""
+    return hashlib.md5('\x1f'.join(value or '' for value in row[1:]).encode('utf-8')).hexdigest()
+
+def fetch_user_fingerprints(cursor, ssns):
+    """Load {SSN: fingerprint} for the existing users among ssns, in chunked IN queries.
+
+    Keys are upper-cased: MySQL matches ssn case-insensitively, so look rows up with ssn.upper().
+    """
+    fingerprints = {}
+    for chunk, placeholders in in_clause_chunks(ssns):
+        cursor.execute(f"SELECT ssn, {USER_FINGERPRINT_SQL} FROM User WHERE ssn IN ({placeholders})", chunk)
+        fingerprints.update((ssn.upper(), fingerprint) for ssn, fingerprint in cursor.fetchall())
+    return fingerprints
+
 # --- File Upload API ---
 @app.route('/api/upload_data', methods=['POST'])
 @login_required
 @role_required(['Admin'])
+@admission_control('heavy')
 def upload_data():
     if 'file' not in request.files:
         return jsonify({"message": "No file part"}), 400
@@ -414,19 +997,25 @@ def upload_data():
     if file.filename == '':
         return jsonify({"message": "No selected file"}), 400
     
+    # 'upsert' rewrites every row; 'diff' only writes rows that are new or changed
+    mode = request.form.get('mode', 'upsert')
+    if mode not in ('upsert', 'diff'):
+        return jsonify({"message": "Invalid import mode. Use 'upsert' or 'diff'."}), 400
+
     if file and allowed_file(file.filename):
+        import pandas as pd # Imported on first upload; see the note at the top of the file
         filename = secure_filename(file.filename)
         filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
         
         try:
             file.save(filepath)
-            expected_columns = {'ssn', 'name', 'email', 'address', 'date_of_birth'} # For User table
+            expected_columns = set(USER_UPLOAD_COLUMNS) # For User table
 
             try:
                 if filename.endswith('.csv'):
-                    df = pd.read_csv(filepath)
+                    df = pd.read_csv(filepath, dtype=str)
                 elif filename.endswith('.xlsx'):
-                    df = pd.read_excel(filepath)
+                    df = pd.read_excel(filepath, dtype=str)
                 else:
                     # This case should ideally not be reached if allowed_file is comprehensive
                     return jsonify({"message": "Unsupported file type. Only CSV or XLSX allowed."}), 400
@@ -438,7 +1027,7 @@ def upload_data():
                 return jsonify({"message": f"Error reading file: {e}. Ensure it is a valid CSV or XLSX file."}), 400
 
             # Validate columns for User table upload
-            if not expected_columns.issubset(df.columns):
+            if set(df.columns) != expected_columns:
                 missing = expected_columns - set(df.columns)
                 extra = set(df.columns) - expected_columns
                 error_message = "Uploaded file columns do not match expected 'User' table structure. "
@@ -449,6 +1038,18 @@ def upload_data():
                 error_message += "Please ensure the file has exactly these headers: ssn, name, email, address, date_of_birth."
                 return jsonify({"message": error_message}), 400
 
+            # Validate every row before touching the database
+            valid_df, rejected_df = validate_user_rows(df)
+            report = {}
+            if len(rejected_df):
+                report = {
+                    "rows_rejected": len(rejected_df),
+                    "report_id": store_upload_report(rejected_df),
+                    "errors": rejected_df.head(100).to_dict('records'),
+                }
+            if valid_df.empty:
+                return jsonify({"message": f"No valid rows to import. {len(rejected_df)} rows rejected.", **report}), 400
+
             conn = get_db_connection()
             if not conn: return jsonify({"message": "Database connection error"}), 500
             
@@ -458,28 +1059,39 @@ def upload_data():
             # --- IMPORTANT: This logic is currently specific to the 'User' table. ---
             # For other tables, a more generic approach or different endpoints would be needed.
             try:
-                for index, row in df.iterrows():
-                    # Check for presence of all expected columns for safety, though covered by above check
-                    if not all(col in row for col in expected_columns):
-                         # This individual row check might be redundant if df.columns check is robust
-                        conn.rollback() # Rollback any partial commits if processing row by row transactionally
-                        return jsonify({"message": f"Row {index + 2} is missing required data. All columns (ssn, name, email, address, date_of_birth) must have values."}), 400
-
-                    sql = """
-                        INSERT INTO User (ssn, name, email, address, date_of_birth)
-                        VALUES (%s, %s, %s, %s, %s)
-                        ON DUPLICATE KEY UPDATE name=VALUES(name), email=VALUES(email), address=VALUES(address), date_of_birth=VALUES(date_of_birth)
-                    """
-                    cursor.execute(sql, (
-                        row['ssn'], # Changed from row.get('ssn') to direct access after column validation
-                        row['name'],
-                        row['email'],
-                        row['address'],
-                        row['date_of_birth']
-                    ))
-                    rows_processed += 1
-                conn.commit()
-                return jsonify({"message": f"File uploaded and {rows_processed} rows processed successfully for 'User' table!"}), 200
+                sql = """
+                    INSERT INTO User (ssn, name, email, address, date_of_birth)
+                    VALUES (%s, %s, %s, %s, %s)
+                    ON DUPLICATE KEY UPDATE name=VALUES(name), email=VALUES(email), address=VALUES(address), date_of_birth=VALUES(date_of_birth)
+                """
+                if mode == 'diff':
+                    rows = list(valid_df.itertuples(index=False, name=None))
+                    existing = fetch_user_fingerprints(cursor, [row[0] for row in rows])
+                    new_rows = [row for row in rows if row[0].upper() not in existing]
+                    changed_rows = [row for row in rows
+                                    if row[0].upper() in existing and existing[row[0].upper()] != user_fingerprint(row)]
+                    if new_rows or changed_rows:
+                        cursor.executemany(sql, new_rows + changed_rows)
+                    conn.commit()
+                    rows_processed = len(rows)
+                    report.update({
+                        "rows_inserted": len(new_rows),
+                        "rows_updated": len(changed_rows),
+                        "rows_unchanged": rows_processed - len(new_rows) - len(changed_rows),
+                    })
+                    message = (f"File uploaded and {rows_processed} rows processed successfully for 'User' table! "
+                               f"{report['rows_inserted']} inserted, {report['rows_updated']} updated, "
+                               f"{report['rows_unchanged']} unchanged.")
+                else:
+                    for row in valid_df.itertuples(index=False, name=None):
+                        cursor.execute(sql, row)
+                        rows_processed += 1
+                    conn.commit()
+                    message = f"File uploaded and {rows_processed} rows processed successfully for 'User' table!"
+                if 'rows_rejected' in report:
+                    message += f" {report['rows_rejected']} rows rejected; download the error report for details."
+                publish_event('users_uploaded', ['Admin'])
+                return jsonify({"message": message, "rows_processed": rows_processed, **report}), 200
             except KeyError as e: # Should be largely caught by the column check above
                 conn.rollback()
                 return jsonify({"message": f"Error accessing data: Missing column {e} in a row. This should have been caught by initial column validation."}), 400
@@ -508,27 +1120,211 @@ def upload_data():
     else:
         return jsonify({"message": "Allowed file types are CSV, XLSX"}), 400
 
-# --- Stored Procedure API ---
-@app.route('/api/failing_students_count', methods=['GET'])
+@app.route('/api/upload_report/<string:report_id>', methods=['GET'])
 @login_required
 @role_required(['Admin'])
-def get_failing_students_count():
+def download_upload_report(report_id):
+    path = upload_report_path(report_id)
+    try:
+        if path is None or os.path.getmtime(path) < time.time() - UPLOAD_REPORT_TTL_SECONDS:
+            raise FileNotFoundError(report_id)
+        with open(path, encoding='utf-8') as report_file:
+            csv_data = report_file.read()
+    except FileNotFoundError:
+        return jsonify({"message": "Upload report not found or expired."}), 404
+
+    response = make_response(csv_data)
+    response.headers["Content-Disposition"] = f"attachment; filename=upload_errors_{report_id}.csv"
+    response.headers["Content-type"] = "text/csv"
+    return response
+
+# --- Terms API ---
+@app.route('/api/terms', methods=['GET'])
+@login_required
+def get_terms():
+    conn = get_db_connection()
+    if not conn: return jsonify({"message": "Database connection error"}), 500
+
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute("SELECT term_id, name, start_date, end_date, status FROM Term ORDER BY start_date DESC")
+        return jsonify(cursor.fetchall()), 200
+    except mysql.connector.Error as err:
+        return jsonify({"message": f"Error fetching terms: {err}"}), 500
+    finally:
+        cursor.close()
+        conn.close()
+
+@app.route('/api/terms/<int:term_id>/archive', methods=['POST'])
+@login_required
+@role_required(['Admin'])
+@admission_control('heavy')
+def archive_term(term_id):
     conn = get_db_connection()
     if not conn: return jsonify({"message": "Database connection error"}), 500
 
     cursor = conn.cursor()
-    fail_count = 0
     try:
-        cursor.callproc('CountFailingStudents', (0,))
-        for result in cursor.stored_results():
-            fail_count = result.fetchone()[0]
-        return jsonify({"failing_students_count": fail_count}), 200
+        # ArchiveTerm moves the term's rows to the archive tables and commits in one transaction
+        result = cursor.callproc('ArchiveTerm', (term_id, 0))
+        invalidate_grade_statistics()
+        publish_event('term_archived', ['Admin', 'InternshipCoordinator'])
+        return jsonify({"message": f"Term {term_id} archived.", "archived_rows": result[1]}), 200
     except mysql.connector.Error as err:
-        return jsonify({"message": f"Error calling stored procedure: {err}"}), 500
+        if err.errno == 1644: # SIGNAL from ArchiveTerm: term missing or not closed
+            return jsonify({"message": f"Cannot archive term {term_id}: {err.msg}"}), 409
+        return jsonify({"message": f"Database error archiving term: {err}"}), 500
     finally:
         cursor.close()
         conn.close()
 
+# --- Grade Statistics API ---
+GRADE_STATS_CACHE_TTL_SECONDS = 60
+GRADE_STATS_PERCENTILES = (25, 50, 75, 90)
+GRADE_STATS_CACHE = {}
+GRADE_STATS_CACHE_LOCK = threading.Lock()
+# Bumped by every invalidation; a computation that started under an older generation is not cached
+GRADE_STATS_GENERATION = 0
+
+def invalidate_grade_statistics():
+    """Drop cached statistics after evaluations or internships change."""
+    global GRADE_STATS_GENERATION
+    with GRADE_STATS_CACHE_LOCK:
+        GRADE_STATS_GENERATION += 1
+        GRADE_STATS_CACHE.clear()
+
+def score_percentile(score_counts, total, percentile):
+    """Nearest-rank percentile from a sorted [(score, count), ...] histogram."""
+    rank = max(1, -(-percentile * total // 100)) # ceil(percentile/100 * total)
+    seen = 0
+    for score, count in score_counts:
+        seen += count
+        if seen >= rank:
+            return score
+    return None
+
+def summarize_scores(score_totals):
+    """count/mean/min/max/percentiles of performance_score from a {score: count} histogram."""
+    score_counts = sorted(score_totals.items())
+    total = sum(score_totals.values())
+    if not total:
+        return {"count": 0, "mean": None, "min": None, "max": None, "percentiles": {}}
+    return {
+        "count": total,
+        "mean": round(sum(score * count for score, count in score_counts) / total, 2),
+        "min": score_counts[0][0],
+        "max": score_counts[-1][0],
+        "percentiles": {f"p{p}": score_percentile(score_counts, total, p) for p in GRADE_STATS_PERCENTILES},
+    }
+
+def compute_grade_statistics(grouped_rows):
+    """Fold the grouped (company, coordinator, grade, score, count) rows into histograms and breakdowns."""
+    grades = {}
+    scores = {}
+    breakdowns = {'company_name': {}, 'coordinator_name': {}}
+    for row in grouped_rows:
+        grade = row['final_grade'] or 'Ungraded'
+        score, count = row['performance_score'], row['evaluations']
+        grades[grade] = grades.get(grade, 0) + count
+        if score is not None:
+            scores[score] = scores.get(score, 0) + count
+        for column, groups in breakdowns.items():
+            group = groups.setdefault(row[column], {"evaluations": 0, "grades": {}, "scores": {}})
+            group["evaluations"] += count
+            group["grades"][grade] = group["grades"].get(grade, 0) + count
+            if score is not None:
+                group["scores"][score] = group["scores"].get(score, 0) + count
+
+    def breakdown(column):
+        return [
+            {column: name, "evaluations": group["evaluations"], "grade_histogram": group["grades"],
+             "performance_score": summarize_scores(group["scores"])}
+            for name, group in sorted(breakdowns[column].items(), key=lambda item: (item[0] is None, item[0] or ''))
+        ]
+
+    return {
+        "total_evaluations": sum(grades.values()),
+        "grade_histogram": grades,
+        "performance_score": summarize_scores(scores),
+        "by_company": breakdown('company_name'),
+        "by_coordinator": breakdown('coordinator_name'),
+    }
+
+def get_grade_statistics(scope):
+    """Grade statistics for a term scope from one grouped query, cached for GRADE_STATS_CACHE_TTL_SECONDS.
+
+    Returns None if the database is unreachable.
+    """
+    now = time.monotonic()
+    with GRADE_STATS_CACHE_LOCK:
+        cached = GRADE_STATS_CACHE.get(scope)
+        generation = GRADE_STATS_GENERATION
+    if cached and now - cached[0] < GRADE_STATS_CACHE_TTL_SECONDS:
+        return cached[1]
+
+    conn = get_db_connection()
+    if not conn:
+        return None
+    cursor = conn.cursor(dictionary=True)
+    try:
+        evaluation_term, term_params = term_condition('e.term_id', scope)
+        evaluations = term_scoped_table('Evaluation', 'EvaluationArchive', scope)
+        internships = term_scoped_table('Internship', 'InternshipArchive', scope)
+        cursor.execute(f"""
+            SELECT i.company_name, ic.name AS coordinator_name, e.final_grade, e.performance_score,
+                   COUNT(*) AS evaluations
+            FROM {evaluations} e
+            LEFT JOIN {internships} i ON i.s_id = e.s_id AND i.term_id = e.term_id
+            LEFT JOIN InternshipCoordinator ic ON ic.ic_id = i.ic_id
+            WHERE {evaluation_term}
+            GROUP BY i.company_name, ic.name, e.final_grade, e.performance_score
+        """, term_params)
+        statistics = compute_grade_statistics(cursor.fetchall())
+    finally:
+        cursor.close()
+        conn.close()
+
+    with GRADE_STATS_CACHE_LOCK:
+        # A write committed while we were reading: our result may predate it, so serve it uncached
+        if generation == GRADE_STATS_GENERATION:
+            GRADE_STATS_CACHE[scope] = (now, statistics)
+    return statistics
+
+@app.route('/api/grade_statistics', methods=['GET'])
+@login_required
+@role_required(['Admin'])
+@admission_control('heavy')
+def grade_statistics():
+    try:
+        scope = parse_term_scope()
+    except ValueError as err:
+        return jsonify({"message": str(err)}), 400
+
+    try:
+        statistics = get_grade_statistics(scope)
+        if statistics is None: return jsonify({"message": "Database connection error"}), 500
+        return jsonify(statistics), 200
+    except mysql.connector.Error as err:
+        return jsonify({"message": f"Error computing grade statistics: {err}"}), 500
+
+@app.route('/api/failing_students_count', methods=['GET'])
+@login_required
+@role_required(['Admin'])
+def get_failing_students_count():
+    # Served from the cached grade histogram instead of a CountFailingStudents round trip.
+    # Defaults to every live term, matching the procedure's count over the whole Evaluation table.
+    try:
+        scope = parse_term_scope() if 'term_id' in request.args else ('live', None)
+    except ValueError as err:
+        return jsonify({"message": str(err)}), 400
+
+    try:
+        statistics = get_grade_statistics(scope)
+        if statistics is None: return jsonify({"message": "Database connection error"}), 500
+        return jsonify({"failing_students_count": statistics["grade_histogram"].get('F', 0)}), 200
+    except mysql.connector.Error as err:
+        return jsonify({"message": f"Error counting failing students: {err}"}), 500
+
 @app.route('/api/apply_internship', methods=['POST'])
 @login_required
 @role_required(['Student'])
@@ -542,8 +1338,8 @@ def apply_internship():
 
     cursor = conn.cursor()
     try:
-        # Check if student already has an internship
-        cursor.execute("SELECT * FROM Internship WHERE s_id = %s", (student_id,))
+        # Check if student already has an internship this term (closed terms stay live until archived)
+        cursor.execute(f"SELECT * FROM Internship WHERE s_id = %s AND term_id IN {ACTIVE_TERM_SQL}", (student_id,))
         if cursor.fetchone():
             return jsonify({"message": "Student already has an internship assigned"}), 400
 
@@ -562,6 +1358,8 @@ def apply_internship():
         ))
         
         conn.commit()
+        invalidate_grade_statistics()
+        publish_event('internship_applied', ['Admin', 'InternshipCoordinator', 'Mentor'])
         return jsonify({"message": "Internship application submitted successfully"}), 201
     except mysql.connector.Error as err:
         conn.rollback()
@@ -583,28 +1381,28 @@ def submit_evaluation():
 
     cursor = conn.cursor()
     try:
-        # Check if student exists and has an internship
-        cursor.execute("""
+        # Check if student exists and has an internship in the active term
+        cursor.execute(f"""
             SELECT * FROM Student s
-            JOIN Internship i ON s.ssn = i.s_id
+            JOIN Internship i ON s.ssn = i.s_id AND i.term_id IN {ACTIVE_TERM_SQL}
             WHERE s.ssn = %s
         """, (data['student_id'],))
         
         if not cursor.fetchone():
             return jsonify({"message": "Student not found or no internship assigned"}), 404
 
-        # Check if evaluation already exists
-        cursor.execute("SELECT * FROM Evaluation WHERE s_id = %s", (data['student_id'],))
+        # Check if evaluation already exists this term; a closed term's evaluation is never overwritten
+        cursor.execute(f"SELECT * FROM Evaluation WHERE s_id = %s AND term_id IN {ACTIVE_TERM_SQL}", (data['student_id'],))
         if cursor.fetchone():
             # Update existing evaluation
-            cursor.execute("""
+            cursor.execute(f"""
                 UPDATE Evaluation
                 SET final_grade = %s,
                     comments = %s,
                     performance_score = %s,
                     e_id = %s,
                     c_id = %s
-                WHERE s_id = %s
+                WHERE s_id = %s AND term_id IN {ACTIVE_TERM_SQL}
             """, (
                 data['final_grade'],
                 data['comments'],
@@ -614,7 +1412,7 @@ def submit_evaluation():
                 data['student_id']
             ))
         else:
-            # Insert new evaluation
+            # Insert new evaluation (Evaluation_before_insert assigns the active term)
             cursor.execute("""
                 INSERT INTO Evaluation (s_id, final_grade, comments, performance_score, e_id, c_id)
                 VALUES (%s, %s, %s, %s, %s, %s)
@@ -628,6 +1426,8 @@ def submit_evaluation():
             ))
         
         conn.commit()
+        invalidate_grade_statistics()
+        publish_event('evaluation_submitted', ['Admin', 'InternshipCoordinator', 'Mentor'])
         return jsonify({"message": "Evaluation submitted successfully"}), 201
     except mysql.connector.Error as err:
         conn.rollback()
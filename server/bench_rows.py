@@ -0,0 +1,81 @@
+"""Row handling benchmark: dictionary cursor + jsonify vs. tuple rows + ResultBuffer.
+
+Builds AdminView-shaped rows the way mysql-connector decodes them (one tuple per row),
+then times what each path does on top: the dict path turns every row into a dict, as
+cursor(dictionary=True) does, and serializes with jsonify. The tuple path keeps the tuples
+and encodes them with ResultBuffer. Reports CPU time per row and peak traced memory.
+
+    python bench_rows.py --rows 50000
+"""
+import argparse
+import datetime
+import time
+import tracemalloc
+
+from flask import Flask
+
+from resultset import ResultBuffer
+
+ADMIN_VIEW_COLUMNS = ('student_id', 'student_name', 'email', 'grade', 'mentor_position', 'company_name',
+                      'start_date', 'end_date', 'evaluation_comments', 'term_id')
+GRADES = ('A+', 'A', 'B+', 'B', 'C', 'D', 'F')
+
+
+def make_rows(count):
+    start = datetime.date(2025, 2, 1)
+    return [
+        (23100000 + i, f'Student Number {i}', f'student{i}@aiu.edu.eg', GRADES[i % len(GRADES)],
+         'Supervisor', f'Company {i % 200}', start, start + datetime.timedelta(days=90),
+         'Good performance but needs to improve punctuality.' if i % 3 else None, 1)
+        for i in range(count)
+    ]
+
+
+def dict_path(app, rows):
+    dicts = [dict(zip(ADMIN_VIEW_COLUMNS, row)) for row in rows] # what cursor(dictionary=True) builds
+    return app.json.response(dicts).get_data()
+
+
+def tuple_path(app, rows):
+    return ResultBuffer(ADMIN_VIEW_COLUMNS, rows).to_json(default=app.json.default).encode('ascii')
+
+
+def compact_path(app, rows):
+    return ResultBuffer(ADMIN_VIEW_COLUMNS, rows).to_compact_json(default=app.json.default).encode('ascii')
+
+
+def measure(app, path, rows, repeat):
+    with app.app_context():
+        cpu = []
+        for _ in range(repeat):
+            started = time.process_time()
+            body = path(app, rows)
+            cpu.append(time.process_time() - started)
+        tracemalloc.start()
+        path(app, rows)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return min(cpu), peak, len(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    rows = make_rows(args.rows)
+    with app.app_context():
+        assert dict_path(app, rows[:100]).decode().strip() == tuple_path(app, rows[:100]).decode()
+
+    print(f"{args.rows} AdminView rows, best of {args.repeat}")
+    print(f"{'path':<22}{'us/row':>10}{'total ms':>12}{'peak MB':>10}{'body MB':>10}")
+    for name, path in (('dict + jsonify', dict_path), ('tuples + ResultBuffer', tuple_path),
+                       ('tuples, compact', compact_path)):
+        cpu, peak, size = measure(app, path, rows, args.repeat)
+        print(f"{name:<22}{cpu / args.rows * 1e6:>10.2f}{cpu * 1000:>12.1f}{peak / 2**20:>10.1f}{size / 2**20:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""Cold-start benchmark for a server worker.
+
+Imports app in fresh interpreters and reports the import time and the resident memory
+right after import, i.e. what every worker spawn pays before serving a request. RSS comes
+from resource.getrusage (peak RSS, Linux/macOS) or psutil (Windows); without either it is
+reported as unavailable and the RSS budget is not checked.
+Exits non-zero when the median exceeds the budget, so it can gate CI:
+
+    python bench_startup.py --runs 5 --max-import-ms 400 --max-rss-mb 80
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SERVER_DIR = os.path.abspath(os.path.dirname(__file__))
+
+# Runs inside the fresh interpreter; prints one JSON line with the measurements
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import app
+import_ms = (time.perf_counter() - start) * 1000
+rss_mb = None
+try:
+    import resource
+    # ru_maxrss is in bytes on macOS, KB elsewhere
+    rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (2**20 if sys.platform == 'darwin' else 1024)
+except ImportError: # Windows
+    try:
+        import psutil
+        rss_mb = psutil.Process().memory_info().rss / 2**20
+    except ImportError:
+        pass
+print(json.dumps({
+    "import_ms": import_ms,
+    "rss_mb": rss_mb,
+    "heavy_modules": sorted(m for m in ('pandas', 'numpy') if m in sys.modules),
+}))
+"""
+
+
+def measure_once():
+    result = subprocess.run([sys.executable, '-c', PROBE], cwd=SERVER_DIR,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--max-import-ms', type=float, default=None, help='fail if the median import time exceeds this')
+    parser.add_argument('--max-rss-mb', type=float, default=None, help='fail if the median RSS exceeds this')
+    args = parser.parse_args()
+
+    runs = [measure_once() for _ in range(args.runs)]
+    import_ms = statistics.median(run['import_ms'] for run in runs)
+    rss_values = [run['rss_mb'] for run in runs if run['rss_mb'] is not None]
+    rss_mb = statistics.median(rss_values) if rss_values else None
+    heavy_modules = runs[-1]['heavy_modules']
+
+    print(f"import app: median {import_ms:.1f} ms over {args.runs} runs "
+          f"(min {min(r['import_ms'] for r in runs):.1f}, max {max(r['import_ms'] for r in runs):.1f})")
+    if rss_mb is None:
+        print("baseline RSS after import: unavailable (install psutil to measure it on this platform)")
+    else:
+        print(f"baseline RSS after import: median {rss_mb:.1f} MB")
+    print(f"heavy modules loaded at import: {', '.join(heavy_modules) or 'none'}")
+
+    failures = []
+    if heavy_modules:
+        failures.append(f"{', '.join(heavy_modules)} imported at startup")
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        failures.append(f"import time {import_ms:.1f} ms > budget {args.max_import_ms} ms")
+    if args.max_rss_mb is not None and rss_mb is not None and rss_mb > args.max_rss_mb:
+        failures.append(f"RSS {rss_mb:.1f} MB > budget {args.max_rss_mb} MB")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+import json
+import threading
+from collections import deque
+
+# Sent to a subscriber that fell too far behind; the client should refetch everything.
+RESYNC_FRAME = "event: resync\ndata: {}\n\n"
+
+
+class Subscription:
+    """Pending Server-Sent Events frames for one connected client."""
+
+    def __init__(self, max_pending=100):
+        self._frames = deque()
+        self._cond = threading.Condition()
+        self._max_pending = max_pending
+
+    def push(self, frame):
+        with self._cond:
+            if len(self._frames) >= self._max_pending:
+                # Slow client: drop the backlog and ask it to resync instead of growing without bound
+                self._frames.clear()
+                self._frames.append(RESYNC_FRAME)
+            else:
+                self._frames.append(frame)
+            self._cond.notify()
+
+    def get(self, timeout):
+        """Next frame, or None if nothing arrived within timeout seconds."""
+        with self._cond:
+            if not self._frames:
+                self._cond.wait(timeout)
+            return self._frames.popleft() if self._frames else None
+
+
+class LocalBackend:
+    """Single-process backend: published events go straight to this worker's subscribers."""
+
+    def start(self, deliver):
+        self._deliver = deliver
+
+    def publish(self, message):
+        self._deliver(message)
+
+
+class RedisBackend:
+    """Relays events through Redis pub/sub so every worker process sees them."""
+
+    def __init__(self, url, channel='field_training_events'):
+        import redis # Optional dependency, only needed for multi-worker deployments
+        self._redis = redis.Redis.from_url(url)
+        self._channel = channel
+
+    def start(self, deliver):
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{self._channel: lambda message: deliver(json.loads(message['data']))})
+        pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+
+    def publish(self, message):
+        self._redis.publish(self._channel, json.dumps(message))
+
+
+def create_backend(url=None):
+    """Backend for the EVENT_BUS_URL setting: Redis for redis:// URLs, in-process otherwise."""
+    if url and url.startswith(('redis://', 'rediss://')):
+        return RedisBackend(url)
+    return LocalBackend()
+
+
+class EventBus:
+    """Fans events out to the SSE subscribers of each role."""
+
+    def __init__(self, backend=None, max_pending=100):
+        self._subscribers = {}
+        self._lock = threading.Lock()
+        self._max_pending = max_pending
+        self._backend = backend or LocalBackend()
+        self._backend.start(self._deliver)
+
+    def subscribe(self, role):
+        subscription = Subscription(self._max_pending)
+        with self._lock:
+            self._subscribers.setdefault(role, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, role, subscription):
+        with self._lock:
+            self._subscribers.get(role, set()).discard(subscription)
+
+    def subscriber_count(self, role=None):
+        with self._lock:
+            if role is not None:
+                return len(self._subscribers.get(role, ()))
+            return sum(len(subs) for subs in self._subscribers.values())
+
+    def publish(self, event, data, roles):
+        """Send event to every subscriber of roles, across workers if the backend supports it."""
+        self._backend.publish({"event": event, "data": data, "roles": list(roles)})
+
+    def _deliver(self, message):
+        # Serialize once, then hand the same frame to every subscriber
+        frame = f"event: {message['event']}\ndata: {json.dumps(message['data'], default=str)}\n\n"
+        with self._lock:
+            targets = [sub for role in message['roles'] for sub in self._subscribers.get(role, ())]
+        for subscription in targets:
+            subscription.push(frame)
@@ -0,0 +1,170 @@
+import os
+import random
+import sys
+import threading
+import time
+
+# Each sample is charged to the first matching category, walking from the innermost frame out.
+# (category, path fragment, function names or None for any function in that path)
+SAMPLE_CATEGORIES = (
+    ('db_wait', os.path.join('mysql', 'connector', 'network.py'), None),
+    ('db_wait', 'socket.py', None),
+    # The C extension (used whenever it is installed) has no Python frames below these round trips;
+    # its fetch*/get_rows frames fall through to row_decoding
+    ('db_wait', os.path.join('mysql', 'connector', 'connection_cext.py'), ('cmd_query', 'commit', 'rollback')),
+    ('db_wait', os.path.join('mysql', 'connector', 'cursor_cext.py'), ('execute', 'executemany', 'callproc')),
+    ('row_decoding', os.path.join('mysql', 'connector'), None),
+    ('serialization', os.path.join('json', ''), None),
+    ('serialization', os.path.join('flask', 'json'), None),
+    ('serialization', 'resultset.py', ('iter_json', 'to_json', 'to_compact_json', 'memo', '<listcomp>', '<lambda>')),
+    ('serialization', '', ('jsonify', 'to_dict')),
+)
+CATEGORIES = ('db_wait', 'row_decoding', 'serialization', 'application', 'framework')
+
+
+def classify_stack(frames, app_root):
+    """Category of one sample; frames are (filename, function) pairs from innermost to outermost.
+
+    Time spent below our own code (app_root) that is not DB or serialization work counts as
+    'application'; anything reached without passing through our code is Flask/Werkzeug 'framework'.
+    """
+    for filename, function in frames:
+        for category, fragment, functions in SAMPLE_CATEGORIES:
+            if fragment in filename and (functions is None or function in functions):
+                return category
+        if filename.startswith(app_root):
+            return 'application'
+    return 'framework'
+
+
+class RouteProfile:
+    """Samples and wall time aggregated over every profiled request of one route."""
+
+    def __init__(self):
+        self.requests = 0
+        self.wall_time = 0.0
+        self.samples = 0
+        self.category_samples = dict.fromkeys(CATEGORIES, 0)
+        self.stacks = {}
+
+    def summary(self):
+        # Each category's share of the samples, applied to the measured wall time
+        per_category = {
+            category: round(self.wall_time * count / self.samples, 6) if self.samples else 0.0
+            for category, count in self.category_samples.items()
+        }
+        return {
+            "requests": self.requests,
+            "wall_time_seconds": round(self.wall_time, 6),
+            "mean_wall_time_seconds": round(self.wall_time / self.requests, 6) if self.requests else 0.0,
+            "samples": self.samples,
+            "wall_time_by_category_seconds": per_category,
+        }
+
+
+class SamplingProfiler:
+    """On-demand stack-sampling profiler for request threads.
+
+    When disabled, should_profile() is the only cost per request. When enabled, a sample_rate
+    fraction of requests register their thread, and a background thread records its Python stack
+    every interval seconds. Samples are aggregated per route as collapsed stacks, ready for
+    flamegraph.pl or speedscope.
+    """
+
+    def __init__(self, app_root, interval=0.005):
+        self.app_root = app_root
+        self.interval = interval
+        self.enabled = False
+        self.sample_rate = 1.0
+        self._active = {} # thread id -> route
+        self._routes = {}
+        self._lock = threading.Lock()
+        self._sampler = None
+
+    def configure(self, enabled=None, sample_rate=None, interval=None):
+        with self._lock:
+            if sample_rate is not None:
+                if not 0.0 <= sample_rate <= 1.0:
+                    raise ValueError("sample_rate must be between 0 and 1")
+                self.sample_rate = sample_rate
+            if interval is not None:
+                if interval <= 0:
+                    raise ValueError("interval must be positive")
+                self.interval = interval
+            if enabled is not None:
+                self.enabled = enabled
+            if self.enabled and (self._sampler is None or not self._sampler.is_alive()):
+                self._sampler = threading.Thread(target=self._sample_loop, name='request-profiler', daemon=True)
+                self._sampler.start()
+
+    def settings(self):
+        return {"enabled": self.enabled, "sample_rate": self.sample_rate, "interval_seconds": self.interval}
+
+    def should_profile(self):
+        return self.enabled and random.random() < self.sample_rate
+
+    def begin(self, route):
+        """Start sampling the current thread on behalf of route; returns the token for end()."""
+        thread_id = threading.get_ident()
+        with self._lock:
+            self._active[thread_id] = route
+            self._routes.setdefault(route, RouteProfile())
+        return (thread_id, route, time.perf_counter())
+
+    def end(self, token):
+        thread_id, route, started = token
+        with self._lock:
+            self._active.pop(thread_id, None)
+            profile = self._routes[route]
+            profile.requests += 1
+            profile.wall_time += time.perf_counter() - started
+
+    def reset(self):
+        with self._lock:
+            self._routes = {route: RouteProfile() for route in self._active.values()}
+
+    def routes_summary(self):
+        with self._lock:
+            return {route: profile.summary() for route, profile in self._routes.items()}
+
+    def collapsed_stacks(self, route=None):
+        """Collapsed-stack text ("root;...;leaf count" per line), rooted at the route name."""
+        with self._lock:
+            routes = [route] if route is not None else sorted(self._routes)
+            lines = [
+                f"{name};{stack} {count}"
+                for name in routes if name in self._routes
+                for stack, count in sorted(self._routes[name].stacks.items())
+            ]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+    def _sample_loop(self):
+        while self.enabled:
+            time.sleep(self.interval)
+            with self._lock:
+                active = dict(self._active)
+            if not active:
+                continue
+            current_frames = sys._current_frames()
+            for thread_id, route in active.items():
+                frame = current_frames.get(thread_id)
+                if frame is not None:
+                    self._record(route, frame)
+
+    def _record(self, route, frame):
+        frames = []
+        while frame is not None:
+            code = frame.f_code
+            frames.append((code.co_filename, code.co_name))
+            frame = frame.f_back
+        category = classify_stack(frames, self.app_root)
+        # Parent directory keeps e.g. flask/app.py and server/app.py apart
+        stack = ";".join(f"{'/'.join(filename.split(os.sep)[-2:])}:{function}".replace(';', ',')
+                         for filename, function in reversed(frames))
+        with self._lock:
+            profile = self._routes.get(route)
+            if profile is None:
+                return
+            profile.samples += 1
+            profile.category_samples[category] += 1
+            profile.stacks[stack] = profile.stacks.get(stack, 0) + 1
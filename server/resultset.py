@@ -0,0 +1,84 @@
+import datetime
+import json
+from operator import itemgetter
+
+# Rows turned into objects at a time by to_json(); bounds the dicts alive at once
+ENCODE_CHUNK_ROWS = 1000
+
+
+def memoized_default(default):
+    """Wrap a JSON default hook so repeated dates are converted once per result.
+
+    Date columns repeat heavily (term start/end dates) and Flask's http_date formatting
+    is the most expensive part of serializing them.
+    """
+    if default is None:
+        return None
+    cache = {}
+
+    def memo(value):
+        if isinstance(value, datetime.date):
+            key = (type(value), value)
+            try:
+                return cache[key]
+            except KeyError:
+                cache[key] = converted = default(value)
+                return converted
+        return default(value)
+    return memo
+
+
+class ResultBuffer:
+    """Query result held as column names plus one tuple per row, with no per-row dicts.
+
+    Rows come straight from a plain (non-dictionary) cursor. to_json() produces the same
+    array of objects as jsonify() on dictionary rows (sorted keys, compact, ASCII-escaped),
+    but only ever materializes ENCODE_CHUNK_ROWS dicts at a time, with keys already in
+    sorted order so the C encoder does not sort every row.
+    """
+
+    __slots__ = ('columns', 'rows')
+
+    def __init__(self, columns, rows):
+        self.columns = tuple(columns)
+        self.rows = rows
+
+    @classmethod
+    def fetch(cls, cursor):
+        """Drain a plain cursor after execute()."""
+        return cls(cursor.column_names, cursor.fetchall())
+
+    def __len__(self):
+        return len(self.rows)
+
+    def extend(self, other):
+        self.rows.extend(other.rows)
+
+    def to_dicts(self):
+        return [dict(zip(self.columns, row)) for row in self.rows]
+
+    def iter_json(self, default=None):
+        """Yield the JSON array of objects in pieces (suitable for a streamed response)."""
+        if not self.rows:
+            yield '[]'
+            return
+        order = sorted(range(len(self.columns)), key=self.columns.__getitem__)
+        keys = [self.columns[i] for i in order]
+        # itemgetter with a single index returns a bare value, not a 1-tuple
+        pick = itemgetter(*order) if len(order) > 1 else (lambda row: (row[order[0]],))
+        encode = json.JSONEncoder(default=memoized_default(default), separators=(',', ':'),
+                                  ensure_ascii=True).encode
+        for start in range(0, len(self.rows), ENCODE_CHUNK_ROWS):
+            chunk = [dict(zip(keys, pick(row))) for row in self.rows[start:start + ENCODE_CHUNK_ROWS]]
+            # Swap the chunk's own brackets for the surrounding array's
+            yield ('[' if start == 0 else ',') + encode(chunk)[1:-1]
+        yield ']'
+
+    def to_json(self, default=None):
+        """JSON array of objects, byte-identical to Flask's compact sort_keys output."""
+        return ''.join(self.iter_json(default))
+
+    def to_compact_json(self, default=None):
+        """{"columns": [...], "rows": [[...], ...]}: no per-row keys or dicts at all."""
+        return json.dumps({"columns": self.columns, "rows": self.rows}, default=memoized_default(default),
+                          separators=(',', ':'), ensure_ascii=True)
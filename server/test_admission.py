@@ -0,0 +1,54 @@
+import unittest
+import os
+import sys
+import threading
+import time
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from admission import ConcurrencyLimiter, AdmissionRejected
+
+
+class TestConcurrencyLimiter(unittest.TestCase):
+
+    def test_rejects_when_queue_is_full(self):
+        limiter = ConcurrencyLimiter(max_concurrent=1, max_queue=0)
+        limiter.acquire('U001')
+
+        with self.assertRaises(AdmissionRejected) as ctx:
+            limiter.acquire('U002')
+        self.assertGreaterEqual(ctx.exception.retry_after, 1)
+
+    def test_per_user_limit(self):
+        limiter = ConcurrencyLimiter(max_concurrent=5, per_user_limit=1)
+        limiter.acquire('U001')
+
+        with self.assertRaises(AdmissionRejected):
+            limiter.acquire('U001')
+        limiter.acquire('U002') # other users are unaffected
+
+    def test_queued_request_admitted_on_release(self):
+        limiter = ConcurrencyLimiter(max_concurrent=1, max_queue=1, max_wait=5)
+        token = limiter.acquire('U001')
+        admitted = []
+        waiter = threading.Thread(target=lambda: admitted.append(limiter.acquire('U002')))
+        waiter.start()
+        while limiter.stats()['queued'] == 0:
+            time.sleep(0.01)
+
+        limiter.release('U001', token)
+        waiter.join(timeout=5)
+
+        self.assertEqual(len(admitted), 1)
+        self.assertEqual(limiter.stats(), {"active": 1, "queued": 0, "max_concurrent": 1, "max_queue": 1})
+
+    def test_queued_request_times_out(self):
+        limiter = ConcurrencyLimiter(max_concurrent=1, max_queue=1, max_wait=0.05)
+        limiter.acquire('U001')
+
+        with self.assertRaises(AdmissionRejected):
+            limiter.acquire('U002')
+        self.assertEqual(limiter.stats()['queued'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,6 +22,10 @@ class TestApp(unittest.TestCase):
         # Ensure upload folder exists for tests that might write to it (though we'll mock most of this)
         if not os.path.exists(UPLOAD_FOLDER):
             os.makedirs(UPLOAD_FOLDER)
+        # Most endpoints under test are admin-only
+        with self.app.session_transaction() as sess:
+            sess['ssn'] = 'U005'
+            sess['role'] = 'Admin'
 
     def tearDown(self):
         os.environ = self.original_env
@@ -126,6 +130,34 @@ class TestApp(unittest.TestCase):
         json_response = json.loads(response.data.decode('utf-8'))
         self.assertIn("processed successfully for 'User' table!", json_response['message'])
 
+    @patch('app.get_db_connection')
+    @patch('pandas.read_excel')
+    def test_upload_xlsx_date_cells(self, mock_read_excel, mock_get_db_connection):
+        import datetime
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+
+        # read_excel(dtype=str) turns real date cells into str(datetime)
+        date_cells = [datetime.datetime(2001, 2, 3), datetime.datetime(2002, 3, 4, 10, 30)]
+        mock_read_excel.return_value = pd.DataFrame({
+            'ssn': ['U100', 'U101'], 'name': ['Date Cell', 'Date Time Cell'],
+            'email': ['a@aiu.edu.eg', 'b@aiu.edu.eg'], 'address': [None, None],
+            'date_of_birth': [str(cell) for cell in date_cells],
+        })
+
+        data = {'file': (io.BytesIO(b'dummy xlsx content'), 'roster.xlsx')}
+        with patch('os.path.exists', return_value=True), patch('os.remove'):
+            response = self.app.post('/api/upload_data', content_type='multipart/form-data', data=data)
+
+        self.assertEqual(response.status_code, 200)
+        json_response = json.loads(response.data.decode('utf-8'))
+        self.assertEqual(json_response['rows_processed'], 1)
+        self.assertEqual(mock_cursor.execute.call_args[0][1], ('U100', 'Date Cell', 'a@aiu.edu.eg', None, '2001-02-03'))
+        # A real time of day is still not a date of birth
+        self.assertIn('date_of_birth is not a valid date', json_response['errors'][0]['errors'])
+
     def test_upload_unsupported_extension(self):
         data = {'file': (io.BytesIO(b'dummy content'), 'test.txt')}
         response = self.app.post('/api/upload_data', content_type='multipart/form-data', data=data)
@@ -223,6 +255,174 @@ class TestApp(unittest.TestCase):
         json_response = json.loads(response.data.decode('utf-8'))
         self.assertEqual(json_response['message'], "Could not parse CSV file. Please ensure it is correctly formatted.")
 
+    @patch('app.get_db_connection')
+    @patch('pandas.read_csv')
+    def test_upload_rejects_invalid_rows(self, mock_read_csv, mock_get_db_connection):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+
+        mock_read_csv.return_value = pd.DataFrame({
+            'ssn': ['U100', 'U101', 'U102', 'U102', 'bad ssn!', None],
+            'name': ['Valid User', 'Bad Email', 'Dup One', 'Dup Two', 'Bad Ssn', 'No Ssn'],
+            'email': ['valid@aiu.edu.eg', 'not-an-email', 'd1@aiu.edu.eg', 'd2@aiu.edu.eg', 'b@aiu.edu.eg', 'n@aiu.edu.eg'],
+            'address': ['Cairo', None, None, None, None, None],
+            'date_of_birth': ['2001-02-03', '2001-02-03', '2001-02-03', '2001-02-03', '2001-13-45', '2001-02-03'],
+        })
+
+        data = {'file': (io.BytesIO(b'dummy'), 'test.csv')}
+        with patch('os.path.exists', return_value=True), patch('os.remove'):
+            response = self.app.post('/api/upload_data', content_type='multipart/form-data', data=data)
+
+        self.assertEqual(response.status_code, 200)
+        json_response = json.loads(response.data.decode('utf-8'))
+        self.assertEqual(json_response['rows_processed'], 1)
+        self.assertEqual(json_response['rows_rejected'], 5)
+        mock_cursor.execute.assert_called_once()
+        self.assertEqual(mock_cursor.execute.call_args[0][1], ('U100', 'Valid User', 'valid@aiu.edu.eg', 'Cairo', '2001-02-03'))
+
+        errors = {e['row']: e['errors'] for e in json_response['errors']}
+        self.assertIn('email is not a valid address', errors[3])
+        self.assertIn('ssn appears more than once in the file', errors[4])
+        self.assertIn('ssn appears more than once in the file', errors[5])
+        self.assertIn('ssn must be', errors[6])
+        self.assertIn('date_of_birth is not a valid date', errors[6])
+        self.assertIn('ssn is required', errors[7])
+
+        # Stored under the upload folder, so any worker can serve the download
+        report_id = json_response['report_id']
+        self.assertTrue(os.path.exists(os.path.join(UPLOAD_FOLDER, report_id + '.errors.csv')))
+        report = self.app.get(f"/api/upload_report/{report_id}")
+        self.assertEqual(report.status_code, 200)
+        self.assertEqual(report.headers['Content-type'], 'text/csv')
+        self.assertIn('row,ssn,errors', report.data.decode('utf-8'))
+
+        # Expired reports are no longer served, and are deleted by the next upload
+        expired = os.path.getmtime(os.path.join(UPLOAD_FOLDER, report_id + '.errors.csv')) - 2 * 24 * 60 * 60
+        os.utime(os.path.join(UPLOAD_FOLDER, report_id + '.errors.csv'), (expired, expired))
+        self.assertEqual(self.app.get(f"/api/upload_report/{report_id}").status_code, 404)
+        from app import prune_upload_reports
+        prune_upload_reports()
+        self.assertFalse(os.path.exists(os.path.join(UPLOAD_FOLDER, report_id + '.errors.csv')))
+
+    @patch('app.get_db_connection')
+    @patch('pandas.read_csv')
+    def test_upload_rejects_non_strict_dates_and_case_duplicates(self, mock_read_csv, mock_get_db_connection):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+
+        mock_read_csv.return_value = pd.DataFrame({
+            'ssn': ['U100', 'U101', 'U102', 'U103', 'u104', 'U104'],
+            'name': ['Plain Date', 'With Offset', 'Year Only', 'Year Month', 'Lower', 'Upper'],
+            'email': ['a@aiu.edu.eg', 'b@aiu.edu.eg', 'c@aiu.edu.eg', 'd@aiu.edu.eg', 'e@aiu.edu.eg', 'f@aiu.edu.eg'],
+            'address': [None] * 6,
+            'date_of_birth': ['2000-01-01', '2000-01-01T00:00:00+05:00', '2000', '2000-01', '2000-01-01', '2000-01-01'],
+        })
+
+        data = {'file': (io.BytesIO(b'dummy'), 'test.csv')}
+        with patch('os.path.exists', return_value=True), patch('os.remove'):
+            response = self.app.post('/api/upload_data', content_type='multipart/form-data', data=data)
+
+        self.assertEqual(response.status_code, 200)
+        json_response = json.loads(response.data.decode('utf-8'))
+        self.assertEqual(json_response['rows_processed'], 1)
+        self.assertEqual(mock_cursor.execute.call_args[0][1], ('U100', 'Plain Date', 'a@aiu.edu.eg', None, '2000-01-01'))
+        errors = {e['row']: e['errors'] for e in json_response['errors']}
+        for row in (3, 4, 5):
+            self.assertIn('date_of_birth is not a valid date', errors[row])
+        self.assertIn('ssn appears more than once in the file', errors[6])
+        self.assertIn('ssn appears more than once in the file', errors[7])
+
+    @patch('app.get_db_connection')
+    @patch('pandas.read_csv')
+    def test_upload_all_rows_invalid(self, mock_read_csv, mock_get_db_connection):
+        mock_read_csv.return_value = pd.DataFrame({
+            'ssn': ['U100'], 'name': [None], 'email': ['x@aiu.edu.eg'],
+            'address': ['Cairo'], 'date_of_birth': ['2001-02-03'],
+        })
+
+        data = {'file': (io.BytesIO(b'dummy'), 'test.csv')}
+        with patch('os.path.exists', return_value=True), patch('os.remove'):
+            response = self.app.post('/api/upload_data', content_type='multipart/form-data', data=data)
+
+        self.assertEqual(response.status_code, 400)
+        json_response = json.loads(response.data.decode('utf-8'))
+        self.assertIn("No valid rows to import.", json_response['message'])
+        self.assertEqual(json_response['errors'][0]['errors'], 'name is required')
+        mock_get_db_connection.assert_not_called()
+
+    @patch('app.get_db_connection')
+    @patch('pandas.read_csv')
+    def test_upload_diff_mode_writes_only_changes(self, mock_read_csv, mock_get_db_connection):
+        from app import user_fingerprint
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+
+        unchanged = ('U001', 'Same User', 'same@aiu.edu.eg', 'Cairo', '2001-02-03')
+        changed = ('U002', 'New Name', 'changed@aiu.edu.eg', None, '2002-03-04')
+        new = ('U003', 'New User', 'new@aiu.edu.eg', 'Giza', '2003-04-05')
+        mock_read_csv.return_value = pd.DataFrame([unchanged, changed, new], columns=['ssn', 'name', 'email', 'address', 'date_of_birth'])
+        mock_cursor.fetchall.return_value = [
+            ('U001', user_fingerprint(unchanged)),
+            ('U002', user_fingerprint(('U002', 'Old Name', 'changed@aiu.edu.eg', None, '2002-03-04'))),
+        ]
+
+        data = {'file': (io.BytesIO(b'dummy'), 'test.csv'), 'mode': 'diff'}
+        with patch('os.path.exists', return_value=True), patch('os.remove'):
+            response = self.app.post('/api/upload_data', content_type='multipart/form-data', data=data)
+
+        self.assertEqual(response.status_code, 200)
+        json_response = json.loads(response.data.decode('utf-8'))
+        self.assertEqual(json_response['rows_inserted'], 1)
+        self.assertEqual(json_response['rows_updated'], 1)
+        self.assertEqual(json_response['rows_unchanged'], 1)
+        # One fingerprint lookup for all SSNs, one batched write for new + changed rows
+        mock_cursor.execute.assert_called_once()
+        self.assertEqual(mock_cursor.execute.call_args[0][1], ('U001', 'U002', 'U003'))
+        mock_cursor.executemany.assert_called_once()
+        self.assertEqual(mock_cursor.executemany.call_args[0][1], [new, changed])
+        mock_conn.commit.assert_called_once()
+
+    @patch('app.get_db_connection')
+    @patch('pandas.read_csv')
+    def test_upload_diff_mode_matches_ssn_case_insensitively(self, mock_read_csv, mock_get_db_connection):
+        from app import user_fingerprint
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+
+        unchanged = ('u001', 'Same User', 'same@aiu.edu.eg', 'Cairo', '2001-02-03')
+        renamed = ('u002', 'New Name', 'changed@aiu.edu.eg', None, '2002-03-04')
+        mock_read_csv.return_value = pd.DataFrame([unchanged, renamed], columns=['ssn', 'name', 'email', 'address', 'date_of_birth'])
+        mock_cursor.fetchall.return_value = [
+            ('U001', user_fingerprint(unchanged)),
+            ('U002', user_fingerprint(('U002', 'Old Name', 'changed@aiu.edu.eg', None, '2002-03-04'))),
+        ]
+
+        data = {'file': (io.BytesIO(b'dummy'), 'test.csv'), 'mode': 'diff'}
+        with patch('os.path.exists', return_value=True), patch('os.remove'):
+            response = self.app.post('/api/upload_data', content_type='multipart/form-data', data=data)
+
+        json_response = json.loads(response.data.decode('utf-8'))
+        self.assertEqual(json_response['rows_inserted'], 0)
+        self.assertEqual(json_response['rows_updated'], 1)
+        self.assertEqual(json_response['rows_unchanged'], 1)
+
+    def test_upload_invalid_mode(self):
+        data = {'file': (io.BytesIO(b'dummy'), 'test.csv'), 'mode': 'replace'}
+        response = self.app.post('/api/upload_data', content_type='multipart/form-data', data=data)
+        self.assertEqual(response.status_code, 400)
+
+    def test_upload_report_not_found(self):
+        response = self.app.get('/api/upload_report/doesnotexist')
+        self.assertEqual(response.status_code, 404)
+
     def test_upload_no_file_part(self):
         response = self.app.post('/api/upload_data', content_type='multipart/form-data', data={})
         self.assertEqual(response.status_code, 400)
@@ -236,6 +436,466 @@ class TestApp(unittest.TestCase):
         json_response = json.loads(response.data.decode('utf-8'))
         self.assertEqual(json_response['message'], "No selected file")
 
+    # --- Delta Sync Tests ---
+    @patch('app.get_db_connection')
+    def test_users_full_list_sets_sync_token(self, mock_get_db_connection):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchone.return_value = (42,)
+        mock_cursor.column_names = ('ssn', 'name')
+        mock_cursor.fetchall.return_value = [('U001', 'Test User')]
+
+        response = self.app.get('/api/users')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['X-Sync-Token'], '42')
+        # The token stops short of changes that open write transactions may still commit below it
+        token_sql = mock_cursor.execute.call_args_list[0][0][0]
+        self.assertIn('information_schema.innodb_trx', token_sql)
+        self.assertNotIn('MAX(change_id)', token_sql)
+        self.assertEqual(json.loads(response.data.decode('utf-8')), [{'ssn': 'U001', 'name': 'Test User'}])
+
+    @patch('app.sync_token_sees_transactions', True)
+    @patch('app.get_db_connection')
+    def test_users_sync_token_without_process_privilege(self, mock_get_db_connection):
+        import app as app_module
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        denied = MySQLError(errno=1227, msg="Access denied; you need (at least one of) the PROCESS privilege(s)")
+        mock_cursor.execute.side_effect = [denied, None, None]
+        mock_cursor.fetchone.return_value = (40,)
+        mock_cursor.column_names = ('ssn', 'name')
+        mock_cursor.fetchall.return_value = [('U001', 'Test User')]
+
+        response = self.app.get('/api/users')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['X-Sync-Token'], '40')
+        fallback_sql, fallback_params = mock_cursor.execute.call_args_list[1][0]
+        self.assertNotIn('innodb_trx', fallback_sql)
+        self.assertEqual(fallback_params, (app_module.SYNC_TOKEN_FALLBACK_LAG_SECONDS,))
+        # Later requests go straight to the fallback instead of failing again
+        self.assertFalse(app_module.sync_token_sees_transactions)
+
+    @patch('app.get_db_connection')
+    def test_users_since_returns_only_changes(self, mock_get_db_connection):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchone.side_effect = [(1,), (45,)] # oldest retained change, then the token
+        mock_cursor.column_names = ('ssn', 'name')
+        mock_cursor.fetchall.side_effect = [
+            [('U001',), ('U009',)], # changed keys from ChangeLog
+            [('U001', 'Renamed User')], # U009 was deleted
+        ]
+
+        response = self.app.get('/api/users?since=42')
+
+        self.assertEqual(response.status_code, 200)
+        json_response = json.loads(response.data.decode('utf-8'))
+        self.assertEqual(json_response['token'], '45')
+        self.assertEqual(json_response['changed_keys'], ['U001', 'U009'])
+        self.assertEqual(json_response['rows'], [{'ssn': 'U001', 'name': 'Renamed User'}])
+        changelog_sql, changelog_params = mock_cursor.execute.call_args_list[2][0]
+        self.assertIn('FROM ChangeLog', changelog_sql)
+        self.assertEqual(changelog_params, (42, 'User'))
+        self.assertEqual(mock_cursor.execute.call_args_list[3][0][1], ('U001', 'U009'))
+
+    @patch('app.get_db_connection')
+    def test_users_since_older_than_retained_changelog(self, mock_get_db_connection):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchone.return_value = (100,) # Changes up to 99 were pruned
+
+        response = self.app.get('/api/users?since=42')
+
+        self.assertEqual(response.status_code, 410)
+        self.assertIn('Reload the full list', json.loads(response.data.decode('utf-8'))['message'])
+        mock_cursor.fetchall.assert_not_called()
+
+        mock_cursor.fetchone.side_effect = [(100,), (120,)]
+        mock_cursor.fetchall.return_value = []
+        self.assertEqual(self.app.get('/api/users?since=99').status_code, 200)
+
+    @patch('app.get_db_connection')
+    def test_users_compact_format(self, mock_get_db_connection):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchone.return_value = (42,)
+        mock_cursor.column_names = ('ssn', 'name')
+        mock_cursor.fetchall.return_value = [('U001', 'Test User'), ('U002', None)]
+
+        response = self.app.get('/api/users?format=compact')
+
+        self.assertEqual(json.loads(response.data.decode('utf-8')),
+                         {'columns': ['ssn', 'name'], 'rows': [['U001', 'Test User'], ['U002', None]]})
+
+    def test_dashboard_invalid_since_token(self):
+        response = self.app.get('/api/admin_dashboard_data?since=abc')
+        self.assertEqual(response.status_code, 400)
+
+    # --- Live Updates Tests ---
+    def test_events_stream_pushes_published_events(self):
+        from app import event_bus, publish_event
+        response = self.app.get('/api/events', buffered=False)
+        self.assertEqual(response.mimetype, 'text/event-stream')
+        chunks = iter(response.response)
+        self.assertEqual(next(chunks), b': connected\n\n')
+
+        publish_event('user_added', ['Admin'])
+        self.assertEqual(next(chunks), b'event: user_added\ndata: {}\n\n')
+
+        response.close()
+        self.assertEqual(event_bus.subscriber_count('Admin'), 0)
+
+    @patch('app.publish_event')
+    @patch('app.get_db_connection')
+    def test_submit_evaluation_publishes_event(self, mock_get_db_connection, mock_publish_event):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchone.side_effect = [('student row',), None]
+        with self.app.session_transaction() as sess:
+            sess['ssn'] = 'U003'
+            sess['role'] = 'InternshipEvaluator'
+
+        response = self.app.post('/api/submit_evaluation', json={
+            'student_id': 1, 'final_grade': 'A', 'comments': 'Great', 'performance_score': 95, 'coordinator_id': 1,
+        })
+
+        self.assertEqual(response.status_code, 201)
+        # No student identifiers in the payload, and no broadcast to other students
+        mock_publish_event.assert_called_once_with('evaluation_submitted', ['Admin', 'InternshipCoordinator', 'Mentor'])
+
+    @patch('app.publish_event')
+    @patch('app.get_db_connection')
+    def test_submit_evaluation_leaves_closed_term_evaluation_alone(self, mock_get_db_connection, mock_publish_event):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        # The student's closed-term evaluation is still live (not archived yet), but has no active-term row
+        mock_cursor.fetchone.side_effect = [('student row',), None]
+        with self.app.session_transaction() as sess:
+            sess['ssn'] = 'U003'
+            sess['role'] = 'InternshipEvaluator'
+        payload = {'student_id': 1, 'final_grade': 'A', 'comments': 'Great', 'performance_score': 95, 'coordinator_id': 1}
+
+        self.assertEqual(self.app.post('/api/submit_evaluation', json=payload).status_code, 201)
+        statements = [call[0][0] for call in mock_cursor.execute.call_args_list]
+        active_term = "term_id IN (SELECT term_id FROM Term WHERE status = 'Active')"
+        self.assertIn(active_term, statements[0])
+        self.assertIn(active_term, statements[1])
+        self.assertIn('INSERT INTO Evaluation', statements[2])
+
+        # An existing active-term evaluation is updated, and only within the active term
+        mock_cursor.reset_mock()
+        mock_cursor.fetchone.side_effect = [('student row',), ('active evaluation',)]
+        self.assertEqual(self.app.post('/api/submit_evaluation', json=payload).status_code, 201)
+        update_sql = mock_cursor.execute.call_args_list[2][0][0]
+        self.assertIn('UPDATE Evaluation', update_sql)
+        self.assertIn(active_term, update_sql)
+
+    @patch('app.publish_event')
+    @patch('app.get_db_connection')
+    def test_apply_internship_checks_active_term_only(self, mock_get_db_connection, mock_publish_event):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchone.return_value = None # Only a closed-term internship exists
+        with self.app.session_transaction() as sess:
+            sess['ssn'] = 'U001'
+            sess['role'] = 'Student'
+
+        response = self.app.post('/api/apply_internship', json={
+            'company_name': 'AIU', 'start_date': '2025-02-01', 'end_date': '2025-05-01',
+            'mentor_id': None, 'coordinator_id': 1, 'evaluator_id': 1,
+        })
+
+        self.assertEqual(response.status_code, 201)
+        self.assertIn("term_id IN (SELECT term_id FROM Term WHERE status = 'Active')",
+                      mock_cursor.execute.call_args_list[0][0][0])
+
+    # --- Term Scoping Tests ---
+    @patch('app.get_db_connection')
+    def test_admin_dashboard_defaults_to_active_term(self, mock_get_db_connection):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchone.return_value = (0,)
+        mock_cursor.fetchall.return_value = []
+
+        self.assertEqual(self.app.get('/api/admin_dashboard_data').status_code, 200)
+        sql, params = mock_cursor.execute.call_args[0]
+        self.assertIn("FROM AdminView WHERE term_id IN (SELECT term_id FROM Term WHERE status = 'Active')", sql)
+        self.assertNotIn('AdminArchiveView', sql)
+
+        self.assertEqual(self.app.get('/api/admin_dashboard_data?term_id=3').status_code, 200)
+        sql, params = mock_cursor.execute.call_args[0]
+        self.assertIn('UNION ALL SELECT * FROM AdminArchiveView', sql)
+        self.assertEqual(params, (3,))
+
+        self.assertEqual(self.app.get('/api/admin_dashboard_data?term_id=spring').status_code, 400)
+
+    @patch('app.get_db_connection')
+    def test_student_dashboard_reads_archive_for_past_terms(self, mock_get_db_connection):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = []
+        with self.app.session_transaction() as sess:
+            sess['ssn'] = 'U001'
+            sess['role'] = 'Student'
+
+        self.assertEqual(self.app.get('/api/student_dashboard_data').status_code, 200)
+        sql, params = mock_cursor.execute.call_args[0]
+        self.assertNotIn('Archive', sql)
+
+        self.assertEqual(self.app.get('/api/student_dashboard_data?term_id=1').status_code, 200)
+        sql, params = mock_cursor.execute.call_args[0]
+        self.assertIn('(SELECT * FROM Internship UNION ALL SELECT * FROM InternshipArchive) i', sql)
+        self.assertIn('(SELECT * FROM Evaluation UNION ALL SELECT * FROM EvaluationArchive) e', sql)
+        self.assertEqual(params, (1, 1, 'U001'))
+
+    @patch('app.get_db_connection')
+    def test_archive_term(self, mock_get_db_connection):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.callproc.return_value = (2, 6)
+
+        response = self.app.post('/api/terms/2/archive')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data.decode('utf-8'))['archived_rows'], 6)
+        mock_cursor.callproc.assert_called_once_with('ArchiveTerm', (2, 0))
+
+    @patch('app.get_db_connection')
+    def test_archive_term_not_closed(self, mock_get_db_connection):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.callproc.side_effect = MySQLError(errno=1644, msg='Only closed terms can be archived')
+
+        response = self.app.post('/api/terms/1/archive')
+
+        self.assertEqual(response.status_code, 409)
+        self.assertIn('Only closed terms can be archived', json.loads(response.data.decode('utf-8'))['message'])
+
+    # --- Admission Control Tests ---
+    def test_heavy_endpoint_rejected_when_full(self):
+        from app import ADMISSION_LIMITERS
+        from admission import ConcurrencyLimiter
+        with patch.dict(ADMISSION_LIMITERS, {'heavy': ConcurrencyLimiter(max_concurrent=0)}):
+            response = self.app.get('/api/business_queries')
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response.headers)
+
+    @patch('app.get_db_connection')
+    def test_heavy_endpoint_leaves_room_for_other_users(self, mock_get_db_connection):
+        from app import ADMISSION_LIMITERS
+        mock_get_db_connection.return_value = None
+        heavy = ADMISSION_LIMITERS['heavy']
+        self.assertLess(heavy.per_user_limit, heavy.max_concurrent)
+
+        # U005 already runs as many heavy requests as one user may
+        tokens = [heavy.acquire('U005') for _ in range(heavy.per_user_limit)]
+        try:
+            response = self.app.get('/api/business_queries')
+            self.assertEqual(response.status_code, 429)
+            self.assertIn('for this user', json.loads(response.data.decode('utf-8'))['message'])
+
+            # A second admin still gets a slot
+            with self.app.session_transaction() as sess:
+                sess['ssn'] = 'U006'
+            response = self.app.get('/api/business_queries')
+            self.assertNotEqual(response.status_code, 429)
+        finally:
+            for token in tokens:
+                heavy.release('U005', token)
+
+    # --- Profiling Tests ---
+    @patch('app.get_db_connection')
+    def test_profiling_captures_sampled_routes(self, mock_get_db_connection):
+        mock_get_db_connection.return_value = None
+        self.app.delete('/api/profiling')
+        response = self.app.post('/api/profiling', json={'enabled': True, 'sample_rate': 1})
+        self.assertEqual(json.loads(response.data.decode('utf-8'))['enabled'], True)
+        try:
+            self.app.get('/api/users')
+        finally:
+            self.app.post('/api/profiling', json={'enabled': False})
+
+        routes = json.loads(self.app.get('/api/profiling/routes').data.decode('utf-8'))
+        self.assertEqual(routes['get_users']['requests'], 1)
+        self.assertNotIn('profiling_settings', routes)
+        flamegraph = self.app.get('/api/profiling/flamegraph?route=get_users')
+        self.assertEqual(flamegraph.headers['Content-type'], 'text/plain')
+
+    def test_profiling_rejects_invalid_settings(self):
+        response = self.app.post('/api/profiling', json={'sample_rate': 5})
+        self.assertEqual(response.status_code, 400)
+
+    # --- Grade Statistics Tests ---
+    def test_compute_grade_statistics(self):
+        from app import compute_grade_statistics
+        rows = [
+            {'company_name': 'AIU', 'coordinator_name': 'Omar Tarek', 'final_grade': 'A', 'performance_score': 97, 'evaluations': 2},
+            {'company_name': 'AIU', 'coordinator_name': 'Omar Tarek', 'final_grade': 'F', 'performance_score': 40, 'evaluations': 1},
+            {'company_name': 'Vodafone Egypt', 'coordinator_name': 'Nourhan Ali', 'final_grade': 'B+', 'performance_score': 85, 'evaluations': 1},
+        ]
+
+        stats = compute_grade_statistics(rows)
+
+        self.assertEqual(stats['total_evaluations'], 4)
+        self.assertEqual(stats['grade_histogram'], {'A': 2, 'F': 1, 'B+': 1})
+        self.assertEqual(stats['performance_score']['percentiles'], {'p25': 40, 'p50': 85, 'p75': 97, 'p90': 97})
+        self.assertEqual(stats['performance_score']['mean'], 79.75)
+        self.assertEqual([c['company_name'] for c in stats['by_company']], ['AIU', 'Vodafone Egypt'])
+        self.assertEqual(stats['by_company'][0]['grade_histogram'], {'A': 2, 'F': 1})
+        self.assertEqual(stats['by_coordinator'][1]['performance_score']['max'], 97)
+
+    @patch('app.get_db_connection')
+    def test_grade_statistics_cached_and_invalidated(self, mock_get_db_connection):
+        from app import invalidate_grade_statistics
+        invalidate_grade_statistics()
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [
+            {'company_name': 'AIU', 'coordinator_name': 'Omar Tarek', 'final_grade': 'F', 'performance_score': 40, 'evaluations': 3},
+        ]
+
+        response = self.app.get('/api/grade_statistics?history=1')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data.decode('utf-8'))['grade_histogram'], {'F': 3})
+        # History includes the archived terms
+        self.assertIn('UNION ALL SELECT * FROM EvaluationArchive', mock_cursor.execute.call_args[0][0])
+
+        # Same scope is served from the cache without another query
+        self.app.get('/api/grade_statistics?history=1')
+        mock_cursor.execute.assert_called_once()
+        self.assertIn('GROUP BY', mock_cursor.execute.call_args[0][0])
+
+        # The failing count keeps counting every live term, without the archive, and is cached too
+        response = self.app.get('/api/failing_students_count')
+        self.assertEqual(json.loads(response.data.decode('utf-8')), {'failing_students_count': 3})
+        self.assertNotIn('Archive', mock_cursor.execute.call_args[0][0])
+        self.app.get('/api/failing_students_count')
+        self.assertEqual(mock_cursor.execute.call_count, 2)
+
+        invalidate_grade_statistics()
+        self.app.get('/api/failing_students_count')
+        self.assertEqual(mock_cursor.execute.call_count, 3)
+
+    @patch('app.get_db_connection')
+    def test_grade_statistics_not_cached_across_invalidation(self, mock_get_db_connection):
+        from app import invalidate_grade_statistics, get_grade_statistics
+        invalidate_grade_statistics()
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+
+        # An evaluation commits (and invalidates) while the statistics query is still running
+        def stale_rows():
+            invalidate_grade_statistics()
+            return [{'company_name': 'AIU', 'coordinator_name': None, 'final_grade': 'B', 'performance_score': 80, 'evaluations': 1}]
+        mock_cursor.fetchall.side_effect = stale_rows
+
+        get_grade_statistics(('history', None))
+        get_grade_statistics(('history', None))
+        self.assertEqual(mock_cursor.execute.call_count, 2)
+
+    # --- Search Tests ---
+    def test_build_fulltext_query(self):
+        from app import build_fulltext_query
+        self.assertEqual(build_fulltext_query('Abdel ibra'), '+Abdel* +ibra*')
+        self.assertEqual(build_fulltext_query('+drop* (all) "x"'), '+drop* +all*')
+        self.assertIsNone(build_fulltext_query('ab'))
+
+    @patch('app.get_db_connection')
+    def test_search_ranked_and_paginated(self, mock_get_db_connection):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [{'ssn': 'U001', 'name': 'Abdelrahman Ibrahim', 'score': 1.5}]
+
+        response = self.app.get('/api/search?q=abdel&type=users&page=3&per_page=10')
+
+        self.assertEqual(response.status_code, 200)
+        json_response = json.loads(response.data.decode('utf-8'))
+        self.assertEqual(json_response['results'], {'users': [{'ssn': 'U001', 'name': 'Abdelrahman Ibrahim', 'score': 1.5}]})
+        sql, params = mock_cursor.execute.call_args[0]
+        self.assertIn('MATCH(name, email)', sql)
+        self.assertEqual(params, ('+abdel*', '+abdel*', 10, 20))
+
+    @patch('app.get_db_connection')
+    def test_search_short_query_uses_prefix_lookup(self, mock_get_db_connection):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = []
+
+        response = self.app.get('/api/search?q=a_')
+
+        self.assertEqual(response.status_code, 200)
+        json_response = json.loads(response.data.decode('utf-8'))
+        self.assertEqual(json_response['results']['comments'], [])
+        self.assertEqual(mock_cursor.execute.call_count, 2) # users and companies only
+        self.assertEqual(mock_cursor.execute.call_args_list[0][0][1], ('a\\_%', 'a\\_%', 20, 0))
+        self.assertEqual(mock_cursor.execute.call_args_list[1][0][1], ('a\\_%', 20, 0))
+
+    def test_search_invalid_params(self):
+        self.assertEqual(self.app.get('/api/search').status_code, 400)
+        self.assertEqual(self.app.get('/api/search?q=abdel&type=phones').status_code, 400)
+        self.assertEqual(self.app.get('/api/search?q=abdel&page=x').status_code, 400)
+
+    # --- Cold Start Tests ---
+    def test_app_import_does_not_load_pandas(self):
+        import subprocess
+        result = subprocess.run(
+            [sys.executable, '-c', "import sys, app; print('pandas' in sys.modules, 'numpy' in sys.modules)"],
+            cwd=os.path.abspath(os.path.dirname(__file__)), capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], 'False False')
+
+    @patch('app.get_db_connection')
+    def test_export_report_csv(self, mock_get_db_connection):
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_get_db_connection.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [
+            {'student_id': 23101417, 'name': 'Abdelrahman, Ibrahim', 'final_grade': 'F'},
+            {'student_id': 23101548, 'name': 'Ahmed Abouzied', 'final_grade': None},
+        ]
+
+        response = self.app.get('/api/export_report/low_grade_students')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-type'], 'text/csv')
+        self.assertEqual(response.data.decode('utf-8'),
+                         'student_id,name,final_grade\n23101417,"Abdelrahman, Ibrahim",F\n23101548,Ahmed Abouzied,\n')
+
     # --- General Error Handling Test ---
     @patch('app.get_db_connection')
     def test_db_connection_error_generic_endpoint(self, mock_get_db_connection):
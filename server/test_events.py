@@ -0,0 +1,42 @@
+import unittest
+import os
+import sys
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from events import EventBus, RESYNC_FRAME
+
+
+class TestEventBus(unittest.TestCase):
+
+    def test_publish_reaches_only_target_roles(self):
+        bus = EventBus()
+        admin = bus.subscribe('Admin')
+        student = bus.subscribe('Student')
+
+        bus.publish('user_added', {'ssn': 'U001'}, ['Admin'])
+
+        self.assertEqual(admin.get(timeout=0), 'event: user_added\ndata: {"ssn": "U001"}\n\n')
+        self.assertIsNone(student.get(timeout=0))
+
+    def test_unsubscribe_stops_delivery(self):
+        bus = EventBus()
+        admin = bus.subscribe('Admin')
+        bus.unsubscribe('Admin', admin)
+
+        bus.publish('user_added', {'ssn': 'U001'}, ['Admin'])
+
+        self.assertIsNone(admin.get(timeout=0))
+        self.assertEqual(bus.subscriber_count(), 0)
+
+    def test_slow_subscriber_gets_resync(self):
+        bus = EventBus(max_pending=2)
+        admin = bus.subscribe('Admin')
+        for i in range(3):
+            bus.publish('user_added', {'ssn': f'U00{i}'}, ['Admin'])
+
+        self.assertEqual(admin.get(timeout=0), RESYNC_FRAME)
+        self.assertIsNone(admin.get(timeout=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
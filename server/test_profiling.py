@@ -0,0 +1,78 @@
+import unittest
+import os
+import sys
+import time
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from profiling import SamplingProfiler, classify_stack
+
+APP_ROOT = os.path.join(os.sep, 'srv', 'server')
+SITE = os.path.join(os.sep, 'venv', 'site-packages')
+
+
+class TestClassifyStack(unittest.TestCase):
+
+    def test_categories(self):
+        view = (os.path.join(APP_ROOT, 'app.py'), 'get_users')
+        dispatch = (os.path.join(SITE, 'flask', 'app.py'), 'dispatch_request')
+
+        db_wait = [(os.path.join(SITE, 'mysql', 'connector', 'network.py'), 'recv_plain'), view, dispatch]
+        decoding = [(os.path.join(SITE, 'mysql', 'connector', 'conversion.py'), 'row_to_python'), view, dispatch]
+        cext_query = [(os.path.join(SITE, 'mysql', 'connector', 'connection_cext.py'), 'cmd_query'),
+                      (os.path.join(SITE, 'mysql', 'connector', 'cursor_cext.py'), 'execute'), view, dispatch]
+        cext_fetch = [(os.path.join(SITE, 'mysql', 'connector', 'connection_cext.py'), 'get_rows'),
+                      (os.path.join(SITE, 'mysql', 'connector', 'cursor_cext.py'), 'fetchall'), view, dispatch]
+        serialization = [(os.path.join(SITE, 'flask', 'json', 'provider.py'), 'dumps'), view, dispatch]
+        result_encoding = [(os.path.join(APP_ROOT, 'resultset.py'), '<listcomp>'),
+                           (os.path.join(APP_ROOT, 'resultset.py'), 'iter_json'), view, dispatch]
+        application = [(os.path.join(SITE, 'pandas', 'core', 'frame.py'), '__init__'), view, dispatch]
+        framework = [(os.path.join(SITE, 'werkzeug', 'serving.py'), 'write'), dispatch]
+
+        self.assertEqual(classify_stack(db_wait, APP_ROOT), 'db_wait')
+        self.assertEqual(classify_stack(decoding, APP_ROOT), 'row_decoding')
+        self.assertEqual(classify_stack(cext_query, APP_ROOT), 'db_wait')
+        self.assertEqual(classify_stack(cext_fetch, APP_ROOT), 'row_decoding')
+        self.assertEqual(classify_stack(serialization, APP_ROOT), 'serialization')
+        self.assertEqual(classify_stack(result_encoding, APP_ROOT), 'serialization')
+        self.assertEqual(classify_stack(application, APP_ROOT), 'application')
+        self.assertEqual(classify_stack(framework, APP_ROOT), 'framework')
+
+
+class TestSamplingProfiler(unittest.TestCase):
+
+    def test_samples_are_aggregated_per_route(self):
+        profiler = SamplingProfiler(os.path.abspath(os.path.dirname(__file__)), interval=0.001)
+        profiler.configure(enabled=True)
+        try:
+            token = profiler.begin('slow_route')
+            deadline = time.monotonic() + 0.05
+            while time.monotonic() < deadline:
+                pass
+            profiler.end(token)
+        finally:
+            profiler.configure(enabled=False)
+
+        summary = profiler.routes_summary()['slow_route']
+        self.assertEqual(summary['requests'], 1)
+        self.assertGreater(summary['samples'], 0)
+        self.assertAlmostEqual(sum(summary['wall_time_by_category_seconds'].values()), summary['wall_time_seconds'], places=3)
+        stacks = profiler.collapsed_stacks('slow_route')
+        self.assertTrue(stacks.startswith('slow_route;'))
+        self.assertIn('test_profiling.py:test_samples_are_aggregated_per_route', stacks)
+
+    def test_disabled_profiler_never_samples(self):
+        profiler = SamplingProfiler('/srv')
+        self.assertFalse(profiler.should_profile())
+        profiler.configure(sample_rate=0.0, enabled=True)
+        try:
+            self.assertFalse(profiler.should_profile())
+        finally:
+            profiler.configure(enabled=False)
+
+    def test_invalid_sample_rate(self):
+        with self.assertRaises(ValueError):
+            SamplingProfiler('/srv').configure(sample_rate=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
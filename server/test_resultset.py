@@ -0,0 +1,47 @@
+import unittest
+import os
+import sys
+import datetime
+import json
+from decimal import Decimal
+from unittest.mock import patch
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from flask import Flask
+from resultset import ResultBuffer
+
+
+class TestResultBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+
+    def test_to_json_matches_jsonify(self):
+        columns = ('student_id', 'student_name', 'grade', 'start_date', 'score', 'active', 'ratio', 'percent%')
+        rows = [
+            (23101417, 'Abdelrahman "Abdo" Ibrahim', 'A', datetime.date(2025, 2, 1), Decimal('97.50'), True, 0.5, 1),
+            (23101548, 'Ahmed Abouzied é', None, None, None, False, float('nan'), 2),
+        ]
+        result = ResultBuffer(columns, rows)
+
+        with self.app.app_context():
+            expected = self.app.json.response(result.to_dicts()).get_data(as_text=True)
+            actual = result.to_json(default=self.app.json.default) + '\n'
+
+        self.assertEqual(actual, expected)
+
+    def test_to_json_across_chunks(self):
+        result = ResultBuffer(('ssn',), [(f'U00{i}',) for i in range(5)])
+        with patch('resultset.ENCODE_CHUNK_ROWS', 2):
+            self.assertEqual(json.loads(result.to_json()), [{'ssn': f'U00{i}'} for i in range(5)])
+
+    def test_empty_result(self):
+        self.assertEqual(ResultBuffer(('ssn',), []).to_json(), '[]')
+
+    def test_to_compact_json(self):
+        result = ResultBuffer(('ssn', 'name'), [('U001', 'Test User')])
+        self.assertEqual(json.loads(result.to_compact_json()), {'columns': ['ssn', 'name'], 'rows': [['U001', 'Test User']]})
+
+
+if __name__ == '__main__':
+    unittest.main()
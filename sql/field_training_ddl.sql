@@ -68,6 +68,16 @@ CREATE TABLE Admin (
     FOREIGN KEY (ssn) REFERENCES User(ssn)
 );
 
+-- Table: Term (academic term / training cohort; historical data is scoped by term)
+CREATE TABLE Term (
+    term_id INT PRIMARY KEY,
+    name VARCHAR(50),
+    start_date DATE,
+    end_date DATE,
+    status ENUM('Active', 'Closed', 'Archived') DEFAULT 'Active',
+    INDEX idx_term_status (status)
+);
+
 -- Modified Table: Internship
 CREATE TABLE Internship (
     int_number INT PRIMARY KEY,
@@ -79,6 +89,9 @@ CREATE TABLE Internship (
     ie_id INT,
     ic_id INT,
     company_name VARCHAR(255),  -- added column
+    term_id INT,
+    INDEX idx_internship_term_student (term_id, s_id),
+    FOREIGN KEY (term_id) REFERENCES Term(term_id),
     FOREIGN KEY (s_id) REFERENCES Student(student_id),
     FOREIGN KEY (ie_id) REFERENCES InternshipEvaluator(ie_id),
     FOREIGN KEY (ic_id) REFERENCES InternshipCoordinator(ic_id)
@@ -91,6 +104,9 @@ CREATE TABLE StudentInternship (
     int_number INT,
     ie_id INT,
     ic_id INT,
+    term_id INT,
+    INDEX idx_studentinternship_term (term_id),
+    FOREIGN KEY (term_id) REFERENCES Term(term_id),
     FOREIGN KEY (s_id) REFERENCES Student(student_id),
     FOREIGN KEY (int_number) REFERENCES Internship(int_number),
     FOREIGN KEY (ie_id) REFERENCES InternshipEvaluator(ie_id),
@@ -106,7 +122,42 @@ CREATE TABLE Evaluation (
     ie_id INT,
     ic_id INT,
     s_id INT,
+    term_id INT,
+    INDEX idx_evaluation_term_student (term_id, s_id),
+    FOREIGN KEY (term_id) REFERENCES Term(term_id),
     FOREIGN KEY (ie_id) REFERENCES InternshipEvaluator(ie_id),
     FOREIGN KEY (ic_id) REFERENCES InternshipCoordinator(ic_id),
     FOREIGN KEY (s_id) REFERENCES Student(student_id)
 );
+
+-- Table: ChangeLog (row-level change tracking for delta sync, filled by triggers in phase5_Sql_Script.sql)
+-- The sync token reads information_schema.innodb_trx, which needs the PROCESS privilege when the
+-- server does not connect as root:  GRANT PROCESS ON *.* TO 'ftm_app'@'localhost';
+-- Without it, tokens lag by SYNC_TOKEN_FALLBACK_LAG_SECONDS instead.
+CREATE TABLE ChangeLog (
+    change_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    table_name VARCHAR(30) NOT NULL,
+    row_key VARCHAR(20) NOT NULL,
+    student_id INT,
+    op ENUM('insert', 'update', 'delete') NOT NULL,
+    -- Set by the triggers to SYSDATE(6), the moment the change_id was taken (see get_sync_token)
+    changed_at TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    INDEX idx_changelog_student (student_id),
+    INDEX idx_changelog_changed_at (changed_at) -- retention pruning (PruneChangeLog)
+);
+
+-- Search indexes (used by /api/search): full-text for ranked word/prefix matching,
+-- B-tree for short prefix lookups
+CREATE FULLTEXT INDEX ft_user_name_email ON User(name, email);
+CREATE FULLTEXT INDEX ft_internship_company ON Internship(company_name);
+CREATE FULLTEXT INDEX ft_evaluation_comments ON Evaluation(comments);
+CREATE INDEX idx_user_name ON User(name);
+CREATE INDEX idx_user_email ON User(email);
+CREATE INDEX idx_internship_company ON Internship(company_name);
+
+-- Archive tables for closed terms (filled by the ArchiveTerm procedure in phase5_Sql_Script.sql).
+-- CREATE TABLE ... LIKE copies columns and indexes but not foreign keys, so archived rows
+-- no longer hold locks on or constrain the live tables.
+CREATE TABLE InternshipArchive LIKE Internship;
+CREATE TABLE StudentInternshipArchive LIKE StudentInternship;
+CREATE TABLE EvaluationArchive LIKE Evaluation;
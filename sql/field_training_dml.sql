@@ -12,6 +12,10 @@ VALUES ('U005', 'Omar Tarek', 'omar@aiu.edu.eg', 'Tanta', '2001-12-05');
 INSERT INTO `User` (`ssn`, `name`, `email`, `address`, `date_of_birth`) 
 VALUES ('U006', 'Nourhan Ali', 'nourhan@aiu.edu.eg', 'Assiut', '2002-09-17');
 
+-- Term table (referenced by Internship, StudentInternship and Evaluation)
+INSERT INTO `Term` (`term_id`, `name`, `start_date`, `end_date`, `status`) 
+VALUES (1, 'Spring 2025', '2025-02-01', '2025-06-30', 'Active');
+
 -- Phone table (references User)
 INSERT INTO `Phone` (`phone_id`, `phone_number`, `ssn`) VALUES (1, 1012345601, 'U001');
 INSERT INTO `Phone` (`phone_id`, `phone_number`, `ssn`) VALUES (2, 1012345602, 'U002');
@@ -49,19 +53,19 @@ INSERT INTO `Student` (`student_id`, `ssn`, `level`, `ie_id`, `m_id`, `ic_id`)
 VALUES (23101548, 'U002', 4, 2, 2, 2);
 
 -- Internship table (references Student, InternshipEvaluator, InternshipCoordinator)
-INSERT INTO `Internship` (`int_number`, `status`, `start_date`, `end_date`, `duration`, `s_id`, `ie_id`, `ic_id`, `company_name`) 
-VALUES (1001, 'Approved', '2025-02-01', '2025-05-01', 90, 23101417, 1, 1, 'AIU');
-INSERT INTO `Internship` (`int_number`, `status`, `start_date`, `end_date`, `duration`, `s_id`, `ie_id`, `ic_id`, `company_name`) 
-VALUES (1002, 'Pending', '2025-03-01', '2025-06-01', 92, 23101548, 2, 2, 'Vodafone Egypt');
+INSERT INTO `Internship` (`int_number`, `status`, `start_date`, `end_date`, `duration`, `s_id`, `ie_id`, `ic_id`, `company_name`, `term_id`) 
+VALUES (1001, 'Approved', '2025-02-01', '2025-05-01', 90, 23101417, 1, 1, 'AIU', 1);
+INSERT INTO `Internship` (`int_number`, `status`, `start_date`, `end_date`, `duration`, `s_id`, `ie_id`, `ic_id`, `company_name`, `term_id`) 
+VALUES (1002, 'Pending', '2025-03-01', '2025-06-01', 92, 23101548, 2, 2, 'Vodafone Egypt', 1);
 
 -- StudentInternship table (references Student, Internship, InternshipEvaluator, InternshipCoordinator)
-INSERT INTO `StudentInternship` (`si_id`, `s_id`, `int_number`, `ie_id`, `ic_id`) 
-VALUES (1, 23101417, 1001, 1, 1);
-INSERT INTO `StudentInternship` (`si_id`, `s_id`, `int_number`, `ie_id`, `ic_id`) 
-VALUES (2, 23101548, 1002, 2, 2);
+INSERT INTO `StudentInternship` (`si_id`, `s_id`, `int_number`, `ie_id`, `ic_id`, `term_id`) 
+VALUES (1, 23101417, 1001, 1, 1, 1);
+INSERT INTO `StudentInternship` (`si_id`, `s_id`, `int_number`, `ie_id`, `ic_id`, `term_id`) 
+VALUES (2, 23101548, 1002, 2, 2, 1);
 
 -- Evaluation table (references InternshipEvaluator, InternshipCoordinator, Student)
-INSERT INTO `Evaluation` (`ev_id`, `final_grade`, `comments`, `performance_score`, `ie_id`, `ic_id`, `s_id`) 
-VALUES (1, 'A', 'Outstanding contribution at internship site.', 97, 1, 1, 23101417);
-INSERT INTO `Evaluation` (`ev_id`, `final_grade`, `comments`, `performance_score`, `ie_id`, `ic_id`, `s_id`) 
-VALUES (2, 'B+', 'Good performance but needs to improve punctuality.', 85, 2, 2, 23101548);
+INSERT INTO `Evaluation` (`ev_id`, `final_grade`, `comments`, `performance_score`, `ie_id`, `ic_id`, `s_id`, `term_id`) 
+VALUES (1, 'A', 'Outstanding contribution at internship site.', 97, 1, 1, 23101417, 1);
+INSERT INTO `Evaluation` (`ev_id`, `final_grade`, `comments`, `performance_score`, `ie_id`, `ic_id`, `s_id`, `term_id`) 
+VALUES (2, 'B+', 'Good performance but needs to improve punctuality.', 85, 2, 2, 23101548, 1);
@@ -7,24 +7,27 @@ SELECT
     e.final_grade AS grade,
     i.company_name,
     m.position AS mentor_position,
-    m.type AS mentor_type
+    m.type AS mentor_type,
+    i.term_id
 FROM Student s
 JOIN User u ON s.ssn = u.ssn
 JOIN Evaluation e ON s.student_id = e.s_id
-JOIN Internship i ON s.student_id = i.s_id
+JOIN Internship i ON s.student_id = i.s_id AND i.term_id = e.term_id
 JOIN Mentor m ON s.m_id = m.m_id;
 
 
 -- VIEW 2: CoordinatorView
 CREATE OR REPLACE VIEW CoordinatorView AS
 SELECT 
+    s.student_id,
     ic.name AS coordinator_name,
     u.name AS student_name,
-    e.final_grade AS report_grade
+    e.final_grade AS report_grade,
+    i.term_id
 FROM InternshipCoordinator ic
 JOIN Internship i ON ic.ic_id = i.ic_id
 JOIN Student s ON i.s_id = s.student_id
-JOIN Evaluation e ON s.student_id = e.s_id
+JOIN Evaluation e ON s.student_id = e.s_id AND e.term_id = i.term_id
 JOIN User u ON s.ssn = u.ssn;
 
 
@@ -39,14 +42,50 @@ SELECT
     i.company_name,
     i.start_date,
     i.end_date,
-    e.comments AS evaluation_comments
+    e.comments AS evaluation_comments,
+    i.term_id
 FROM Student s
 JOIN User u ON s.ssn = u.ssn
 JOIN Evaluation e ON s.student_id = e.s_id
-JOIN Internship i ON s.student_id = i.s_id
+JOIN Internship i ON s.student_id = i.s_id AND i.term_id = e.term_id
 JOIN Mentor m ON s.m_id = m.m_id;
 
 
+-- VIEW 4: AdminArchiveView (AdminView over archived terms, read only with ?history=1 or ?term_id=)
+CREATE OR REPLACE VIEW AdminArchiveView AS
+SELECT 
+    s.student_id,
+    u.name AS student_name,
+    u.email,
+    e.final_grade AS grade,
+    m.position AS mentor_position,
+    i.company_name,
+    i.start_date,
+    i.end_date,
+    e.comments AS evaluation_comments,
+    i.term_id
+FROM Student s
+JOIN User u ON s.ssn = u.ssn
+JOIN EvaluationArchive e ON s.student_id = e.s_id
+JOIN InternshipArchive i ON s.student_id = i.s_id AND i.term_id = e.term_id
+JOIN Mentor m ON s.m_id = m.m_id;
+
+
+-- VIEW 5: CoordinatorArchiveView (CoordinatorView over archived terms)
+CREATE OR REPLACE VIEW CoordinatorArchiveView AS
+SELECT 
+    s.student_id,
+    ic.name AS coordinator_name,
+    u.name AS student_name,
+    e.final_grade AS report_grade,
+    i.term_id
+FROM InternshipCoordinator ic
+JOIN InternshipArchive i ON ic.ic_id = i.ic_id
+JOIN Student s ON i.s_id = s.student_id
+JOIN EvaluationArchive e ON s.student_id = e.s_id AND e.term_id = i.term_id
+JOIN User u ON s.ssn = u.ssn;
+
+
 -- BUSINESS QUERIES
 
 -- 1. Internship with highest grade
@@ -102,3 +141,165 @@ BEGIN
 END $$
 
 DELIMITER ;
+
+
+-- CHANGE TRACKING TRIGGERS (feed ChangeLog for the ?since= delta sync endpoints)
+-- changed_at is SYSDATE(6), not NOW(): NOW() is the statement start, which can be long before the
+-- row's change_id is taken in a multi-row INSERT. The sync token relies on the two being close.
+
+DELIMITER $$
+
+CREATE TRIGGER User_after_insert AFTER INSERT ON User
+FOR EACH ROW
+BEGIN
+    INSERT INTO ChangeLog (table_name, row_key, student_id, op, changed_at)
+    VALUES ('User', NEW.ssn, (SELECT student_id FROM Student WHERE ssn = NEW.ssn LIMIT 1), 'insert', SYSDATE(6));
+END $$
+
+-- Upsert uploads rewrite every row: only log rows whose values actually changed
+CREATE TRIGGER User_after_update AFTER UPDATE ON User
+FOR EACH ROW
+BEGIN
+    IF NOT (NEW.ssn <=> OLD.ssn AND NEW.name <=> OLD.name AND NEW.email <=> OLD.email
+            AND NEW.address <=> OLD.address AND NEW.date_of_birth <=> OLD.date_of_birth) THEN
+        INSERT INTO ChangeLog (table_name, row_key, student_id, op, changed_at)
+        VALUES ('User', NEW.ssn, (SELECT student_id FROM Student WHERE ssn = NEW.ssn LIMIT 1), 'update', SYSDATE(6));
+    END IF;
+END $$
+
+CREATE TRIGGER User_after_delete AFTER DELETE ON User
+FOR EACH ROW
+BEGIN
+    INSERT INTO ChangeLog (table_name, row_key, student_id, op, changed_at)
+    VALUES ('User', OLD.ssn, (SELECT student_id FROM Student WHERE ssn = OLD.ssn LIMIT 1), 'delete', SYSDATE(6));
+END $$
+
+CREATE TRIGGER Internship_after_insert AFTER INSERT ON Internship
+FOR EACH ROW
+BEGIN
+    INSERT INTO ChangeLog (table_name, row_key, student_id, op, changed_at)
+    VALUES ('Internship', NEW.int_number, NEW.s_id, 'insert', SYSDATE(6));
+END $$
+
+CREATE TRIGGER Internship_after_update AFTER UPDATE ON Internship
+FOR EACH ROW
+BEGIN
+    INSERT INTO ChangeLog (table_name, row_key, student_id, op, changed_at)
+    VALUES ('Internship', NEW.int_number, NEW.s_id, 'update', SYSDATE(6));
+END $$
+
+CREATE TRIGGER Internship_after_delete AFTER DELETE ON Internship
+FOR EACH ROW
+BEGIN
+    INSERT INTO ChangeLog (table_name, row_key, student_id, op, changed_at)
+    VALUES ('Internship', OLD.int_number, OLD.s_id, 'delete', SYSDATE(6));
+END $$
+
+CREATE TRIGGER Evaluation_after_insert AFTER INSERT ON Evaluation
+FOR EACH ROW
+BEGIN
+    INSERT INTO ChangeLog (table_name, row_key, student_id, op, changed_at)
+    VALUES ('Evaluation', NEW.ev_id, NEW.s_id, 'insert', SYSDATE(6));
+END $$
+
+CREATE TRIGGER Evaluation_after_update AFTER UPDATE ON Evaluation
+FOR EACH ROW
+BEGIN
+    INSERT INTO ChangeLog (table_name, row_key, student_id, op, changed_at)
+    VALUES ('Evaluation', NEW.ev_id, NEW.s_id, 'update', SYSDATE(6));
+END $$
+
+CREATE TRIGGER Evaluation_after_delete AFTER DELETE ON Evaluation
+FOR EACH ROW
+BEGIN
+    INSERT INTO ChangeLog (table_name, row_key, student_id, op, changed_at)
+    VALUES ('Evaluation', OLD.ev_id, OLD.s_id, 'delete', SYSDATE(6));
+END $$
+
+DELIMITER ;
+
+
+-- TERM SCOPING AND ARCHIVAL
+
+DELIMITER $$
+
+-- New rows without an explicit term belong to the active term
+CREATE TRIGGER Internship_before_insert BEFORE INSERT ON Internship
+FOR EACH ROW
+BEGIN
+    IF NEW.term_id IS NULL THEN
+        SET NEW.term_id = (SELECT term_id FROM Term WHERE status = 'Active' ORDER BY start_date DESC LIMIT 1);
+    END IF;
+END $$
+
+CREATE TRIGGER StudentInternship_before_insert BEFORE INSERT ON StudentInternship
+FOR EACH ROW
+BEGIN
+    IF NEW.term_id IS NULL THEN
+        SET NEW.term_id = (SELECT term_id FROM Term WHERE status = 'Active' ORDER BY start_date DESC LIMIT 1);
+    END IF;
+END $$
+
+CREATE TRIGGER Evaluation_before_insert BEFORE INSERT ON Evaluation
+FOR EACH ROW
+BEGIN
+    IF NEW.term_id IS NULL THEN
+        SET NEW.term_id = (SELECT term_id FROM Term WHERE status = 'Active' ORDER BY start_date DESC LIMIT 1);
+    END IF;
+END $$
+
+-- Move every row of a closed term into the archive tables, in one transaction
+CREATE PROCEDURE ArchiveTerm(IN p_term_id INT, OUT archived_rows INT)
+BEGIN
+    DECLARE term_status VARCHAR(10);
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        ROLLBACK;
+        RESIGNAL;
+    END;
+
+    START TRANSACTION;
+    SELECT status INTO term_status FROM Term WHERE term_id = p_term_id FOR UPDATE;
+    IF term_status IS NULL OR term_status <> 'Closed' THEN
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = 'Only closed terms can be archived';
+    END IF;
+
+    INSERT INTO InternshipArchive SELECT * FROM Internship WHERE term_id = p_term_id;
+    SET archived_rows = ROW_COUNT();
+    INSERT INTO StudentInternshipArchive SELECT * FROM StudentInternship WHERE term_id = p_term_id;
+    SET archived_rows = archived_rows + ROW_COUNT();
+    INSERT INTO EvaluationArchive SELECT * FROM Evaluation WHERE term_id = p_term_id;
+    SET archived_rows = archived_rows + ROW_COUNT();
+
+    -- Children first: StudentInternship references Internship
+    DELETE FROM StudentInternship WHERE term_id = p_term_id;
+    DELETE FROM Evaluation WHERE term_id = p_term_id;
+    DELETE FROM Internship WHERE term_id = p_term_id;
+
+    UPDATE Term SET status = 'Archived' WHERE term_id = p_term_id;
+    COMMIT;
+END $$
+
+DELIMITER ;
+
+
+-- CHANGELOG RETENTION
+
+DELIMITER $$
+
+-- Delete ChangeLog rows older than retention_days. The newest row is always kept, so
+-- MIN(change_id) still tells the API which ?since= tokens can no longer be served.
+CREATE PROCEDURE PruneChangeLog(IN retention_days INT, OUT pruned_rows INT)
+BEGIN
+    DELETE FROM ChangeLog
+    WHERE changed_at < NOW(6) - INTERVAL retention_days DAY
+      AND change_id < (SELECT newest FROM (SELECT MAX(change_id) AS newest FROM ChangeLog) AS latest);
+    SET pruned_rows = ROW_COUNT();
+END $$
+
+DELIMITER ;
+
+-- Requires the event scheduler (event_scheduler=ON, the MySQL 8 default)
+CREATE EVENT PruneChangeLogDaily
+ON SCHEDULE EVERY 1 DAY
+DO CALL PruneChangeLog(30, @pruned_rows);
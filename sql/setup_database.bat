@@ -10,4 +10,9 @@ mysql -u root -p FieldTrainingManagement < field_training_dml.sql
 REM Run the phase5 script to create views and stored procedures
 mysql -u root -p FieldTrainingManagement < phase5_Sql_Script.sql
 
+REM If the server connects as a dedicated user instead of root, that user needs the PROCESS
+REM privilege for exact delta-sync tokens (it reads information_schema.innodb_trx), e.g.:
+REM   mysql -u root -p -e "GRANT PROCESS ON *.* TO 'ftm_app'@'localhost';"
+REM Without it the server still works, but tokens lag by SYNC_TOKEN_FALLBACK_LAG_SECONDS.
+
 echo Database setup complete! 
\ No newline at end of file